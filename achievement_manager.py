@@ -4,67 +4,91 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 
-from settings import ACHIEVEMENTS, UPGRADES
+from settings import ACHIEVEMENTS
 
 if TYPE_CHECKING:
     from character_manager import CharacterManager
     from player import Player
 
+    Metric = Callable[["AchievementManager", Player, CharacterManager], float]
+
+
+# 条件タイプ → 現在値 (manager, player, char_mgr)
+# どの条件も「現在値 >= 閾値」で達成となり、フラグ系は 0/1 として扱う
+_METRICS: dict[str, Metric] = {
+    "total_clicks": lambda m, p, c: p.total_clicks,
+    "total_points": lambda m, p, c: p.total_points_earned,
+    "total_upgrades": lambda m, p, c: p.total_upgrade_levels,
+    "all_upgrades_lv": lambda m, p, c: p.min_upgrade_level,
+    "max_affection": lambda m, p, c: c.get_max_affection(),
+    "all_affection": lambda m, p, c: c.get_min_affection(),
+    "first_lucky": lambda m, p, c: m.first_lucky,
+    "first_offline": lambda m, p, c: m.first_offline,
+    "first_event": lambda m, p, c: m.first_event,
+}
+
+
+def _build_buckets() -> dict[str, list[tuple[Any, int, str, dict[str, Any]]]]:
+    """条件タイプごとに (閾値, 定義順, 実績ID, 定義) を閾値の昇順で並べる"""
+    buckets: dict[str, list[tuple[Any, int, str, dict[str, Any]]]] = {}
+    for order, (aid, info) in enumerate(ACHIEVEMENTS.items()):
+        ctype = info["condition"]["type"]
+        if ctype not in _METRICS:
+            continue  # 未知の条件は達成不能
+        buckets.setdefault(ctype, []).append(
+            (info["condition"]["value"], order, aid, info)
+        )
+    for bucket in buckets.values():
+        bucket.sort(key=lambda entry: (entry[0], entry[1]))
+    return buckets
+
+
+_BUCKETS: dict[str, list[tuple[Any, int, str, dict[str, Any]]]] = _build_buckets()
+
 
 class AchievementManager:
     """実績管理クラス"""
 
     def __init__(self) -> None:
         self.unlocked: list[str] = []
+        self._unlocked_set: set[str] = set()
         self.notified: list[str] = []
         # 特殊フラグ
         self.first_lucky: bool = False
         self.first_offline: bool = False
         self.first_event: bool = False
+        # 条件タイプごとに、閾値を越えて判定済みになった件数
+        self._cursors: dict[str, int] = dict.fromkeys(_BUCKETS, 0)
 
     def check_all(
         self, player: Player, char_mgr: CharacterManager
     ) -> list[dict[str, Any]]:
         """全実績をチェックし、新たに達成された実績情報のリストを返す"""
-        newly: list[dict[str, Any]] = []
-        for aid, info in ACHIEVEMENTS.items():
-            if aid in self.unlocked:
+        hits: list[tuple[int, str, dict[str, Any]]] = []
+        cursors = self._cursors
+        for ctype, bucket in _BUCKETS.items():
+            pos = cursors[ctype]
+            if pos >= len(bucket):
                 continue
-            if self._evaluate(aid, info["condition"], player, char_mgr):
-                self.unlocked.append(aid)
-                newly.append({"id": aid, **info})
-        return newly
+            current = _METRICS[ctype](self, player, char_mgr)
+            # 閾値の昇順なので、届かない実績が出た時点で打ち切れる
+            while pos < len(bucket) and bucket[pos][0] <= current:
+                _, order, aid, info = bucket[pos]
+                if aid not in self._unlocked_set:
+                    hits.append((order, aid, info))
+                pos += 1
+            cursors[ctype] = pos
 
-    def _evaluate(
-        self,
-        aid: str,
-        cond: dict[str, Any],
-        player: Player,
-        char_mgr: CharacterManager,
-    ) -> bool:
-        t = cond["type"]
-        v = cond["value"]
-        if t == "total_clicks":
-            return player.total_clicks >= v
-        if t == "total_points":
-            return player.total_points_earned >= v
-        if t == "total_upgrades":
-            return sum(player.upgrade_levels.values()) >= v
-        if t == "all_upgrades_lv":
-            return all(lv >= v for lv in player.upgrade_levels.values())
-        if t == "max_affection":
-            return char_mgr.get_max_affection() >= v
-        if t == "all_affection":
-            return char_mgr.all_affection_above(v)
-        if t == "first_lucky":
-            return self.first_lucky
-        if t == "first_offline":
-            return self.first_offline
-        if t == "first_event":
-            return self.first_event
-        return False
+        hits.sort(key=lambda hit: hit[0])
+        newly: list[dict[str, Any]] = []
+        for _, aid, info in hits:
+            self.unlocked.append(aid)
+            self._unlocked_set.add(aid)
+            newly.append({"id": aid, **info})
+        return newly
 
     def mark_lucky(self) -> None:
         self.first_lucky = True
@@ -78,6 +102,9 @@ class AchievementManager:
     def count(self) -> int:
         return len(self.unlocked)
 
+    def is_unlocked(self, achievement_id: str) -> bool:
+        return achievement_id in self._unlocked_set
+
     # ------------------------------------------------------------------
     # セーブ / ロード
     # ------------------------------------------------------------------
@@ -92,6 +119,8 @@ class AchievementManager:
 
     def from_dict(self, data: dict[str, Any]) -> None:
         self.unlocked = data.get("unlocked", [])
+        self._unlocked_set = set(self.unlocked)
+        self._cursors = dict.fromkeys(_BUCKETS, 0)
         self.notified = data.get("notified", [])
         self.first_lucky = data.get("first_lucky", False)
         self.first_offline = data.get("first_offline", False)
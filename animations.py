@@ -6,22 +6,28 @@ from __future__ import annotations
 
 import math
 import random
-from typing import TypedDict
 
 import pygame
 
 from settings import ANIMATION, COLORS
 
+# パーティクルの基本半径 (3〜8px)
+_PARTICLE_SIZES: range = range(3, 9)
+# ポップアップのフェード段階数
+_POPUP_ALPHA_STEPS: int = 16
 
-class Particle(TypedDict):
-    """パーティクルデータ"""
-    x: float
-    y: float
-    vx: float
-    vy: float
-    life: float
-    color: tuple[int, int, int]
-    size: int
+# (色, 半径) → 円を描いたスプライト
+_CIRCLE_SPRITES: dict[tuple[tuple[int, int, int], int], pygame.Surface] = {}
+
+
+def _circle_sprite(color: tuple[int, int, int], radius: int) -> pygame.Surface:
+    """円スプライトを取得 (初回のみ描画)"""
+    sprite = _CIRCLE_SPRITES.get((color, radius))
+    if sprite is None:
+        sprite = pygame.Surface((radius * 2 + 1, radius * 2 + 1), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, color, (radius, radius), radius)
+        _CIRCLE_SPRITES[(color, radius)] = sprite
+    return sprite
 
 
 class PopupText:
@@ -46,6 +52,11 @@ class PopupText:
         self.duration: float = duration or ANIMATION["popup_duration"]
         self.elapsed: float = 0.0
         self.alive: bool = True
+        # テキストと色は不変なので一度だけレンダリングしておく
+        self._surface: pygame.Surface = font.render(text, True, self.color).convert_alpha()
+        # フェード用のアルファ段階フレーム (必要になった段階だけ生成)
+        self._frames: list[pygame.Surface | None] = [None] * _POPUP_ALPHA_STEPS
+        self._frames[-1] = self._surface
 
     def update(self, dt: float) -> None:
         """更新"""
@@ -64,13 +75,15 @@ class PopupText:
         if not self.alive:
             return
 
-        # アルファ値計算 (フェードアウト)
+        # アルファ段階を選択 (フェードアウト)
         progress: float = self.elapsed / self.duration
-        alpha: int = int(255 * (1 - progress))
-
-        # テキストレンダリング
-        text_surface: pygame.Surface = self.font.render(self.text, True, self.color)
-        text_surface.set_alpha(alpha)
+        idx: int = int((1 - progress) * (_POPUP_ALPHA_STEPS - 1))
+        text_surface: pygame.Surface | None = self._frames[idx]
+        if text_surface is None:
+            text_surface = self._surface.copy()
+            alpha: int = 255 * idx // (_POPUP_ALPHA_STEPS - 1)
+            text_surface.fill((255, 255, 255, alpha), special_flags=pygame.BLEND_RGBA_MULT)
+            self._frames[idx] = text_surface
 
         # 中央揃え
         rect: pygame.Rect = text_surface.get_rect(center=(int(self.x), int(self.y)))
@@ -138,63 +151,95 @@ class ClickAnimation:
         return (scale_x, scale_y)
 
 
-class ParticleEffect:
-    """パーティクルエフェクト"""
+class ParticlePool:
+    """全パーティクルをまとめて保持するプール
 
-    def __init__(self, x: int, y: int, count: int = 10) -> None:
+    フィールドごとの並列リスト (SoA) で保持し、1回の更新で全粒子を進める。
+    寿命は一律 1.0 から同じ速度で減るため、古い粒子ほど先に尽きる。
+    そのため死んだ粒子は常に先頭側に並び、先頭を切り落とすだけで詰められる。
+    """
+
+    def __init__(self, capacity: int | None = None) -> None:
         """初期化"""
-        self.particles: list[Particle] = []
-        for _ in range(count):
-            angle: float = random.uniform(0, 360)
-            speed: float = random.uniform(50, 150)
-            vx: float = math.cos(math.radians(angle)) * speed
-            vy: float = math.sin(math.radians(angle)) * speed
-            color: tuple[int, int, int] = random.choice([
-                COLORS["primary"],
-                COLORS["secondary"],
-                COLORS["accent"],
-                COLORS["gold"],
-            ])
-            self.particles.append({
-                "x": float(x),
-                "y": float(y),
-                "vx": vx,
-                "vy": vy,
-                "life": 1.0,
-                "color": color,
-                "size": random.randint(3, 8),
-            })
-        self.alive: bool = True
+        self.capacity: int = capacity or ANIMATION["max_particles"]
+        self.xs: list[float] = []
+        self.ys: list[float] = []
+        self.vxs: list[float] = []
+        self.vys: list[float] = []
+        self.lives: list[float] = []
+        self.colors: list[tuple[int, int, int]] = []
+        self.sizes: list[int] = []
+        self._palette: list[tuple[int, int, int]] = [
+            COLORS["primary"],
+            COLORS["secondary"],
+            COLORS["accent"],
+            COLORS["gold"],
+        ]
+
+    def __len__(self) -> int:
+        return len(self.lives)
+
+    def add(self, x: int, y: int, count: int) -> None:
+        """パーティクルを追加 (容量超過分は古いものから捨てる)"""
+        count = min(count, self.capacity)
+        overflow: int = len(self.lives) + count - self.capacity
+        if overflow > 0:
+            self._drop_front(overflow)
+        self.xs.extend([float(x)] * count)
+        self.ys.extend([float(y)] * count)
+        self.lives.extend([1.0] * count)
+        # 角度はラジアンで直接サンプリングし、乱数・三角関数はまとめて計算
+        uniform = random.uniform
+        angles: list[float] = [uniform(0, math.tau) for _ in range(count)]
+        speeds: list[float] = [uniform(50, 150) for _ in range(count)]
+        cos, sin = math.cos, math.sin
+        self.vxs.extend([cos(a) * v for a, v in zip(angles, speeds)])
+        self.vys.extend([sin(a) * v for a, v in zip(angles, speeds)])
+        self.colors.extend(random.choices(self._palette, k=count))
+        self.sizes.extend(random.choices(_PARTICLE_SIZES, k=count))
+
+    def _drop_front(self, n: int) -> None:
+        """先頭 n 個を取り除く"""
+        del self.xs[:n], self.ys[:n], self.vxs[:n], self.vys[:n]
+        del self.lives[:n], self.colors[:n], self.sizes[:n]
 
     def update(self, dt: float) -> None:
         """更新"""
-        all_dead: bool = True
-        for p in self.particles:
-            if p["life"] <= 0:
-                continue
-            all_dead = False
-            p["x"] += p["vx"] * dt
-            p["y"] += p["vy"] * dt
-            p["vy"] += 200 * dt  # 重力
-            p["life"] -= dt * 1.5
-
-        if all_dead:
-            self.alive = False
+        if not self.lives:
+            return
+        self.xs = [x + vx * dt for x, vx in zip(self.xs, self.vxs)]
+        self.ys = [y + vy * dt for y, vy in zip(self.ys, self.vys)]
+        gravity: float = 200 * dt  # 重力
+        self.vys = [vy + gravity for vy in self.vys]
+        decay: float = dt * 1.5
+        self.lives = [life - decay for life in self.lives]
+
+        # 寿命が尽きた先頭部分を詰める
+        dead: int = 0
+        for life in self.lives:
+            if life > 0:
+                break
+            dead += 1
+        if dead:
+            self._drop_front(dead)
 
     def draw(self, surface: pygame.Surface) -> None:
         """描画"""
-        for p in self.particles:
-            if p["life"] <= 0:
-                continue
-            size: int = int(p["size"] * p["life"])
-            if size < 1:
-                continue
-            pygame.draw.circle(
-                surface,
-                p["color"],
-                (int(p["x"]), int(p["y"])),
-                size
-            )
+        if not self.lives:
+            return
+        # 整数化と半径 1 未満の除外を先にまとめて済ませる
+        radii: list[int] = [int(s * life) for s, life in zip(self.sizes, self.lives)]
+        visible = [
+            (color, (int(x), int(y)), r)
+            for x, y, color, r in zip(self.xs, self.ys, self.colors, radii)
+            if r >= 1
+        ]
+        # (色, 半径) ごとの円スプライトを 1 回の blits でまとめて描く
+        sprite = _circle_sprite
+        surface.blits(
+            [(sprite(color, r), (x - r, y - r)) for color, (x, y), r in visible],
+            doreturn=False,
+        )
 
 
 class AnimationManager:
@@ -203,7 +248,7 @@ class AnimationManager:
     def __init__(self) -> None:
         """初期化"""
         self.popups: list[PopupText] = []
-        self.particles: list[ParticleEffect] = []
+        self.particles: ParticlePool = ParticlePool()
         self.click_animation: ClickAnimation = ClickAnimation()
 
     def add_popup(
@@ -220,24 +265,36 @@ class AnimationManager:
 
     def add_particles(self, x: int, y: int, count: int = 10) -> None:
         """パーティクルを追加"""
-        effect: ParticleEffect = ParticleEffect(x, y, count)
-        self.particles.append(effect)
+        self.particles.add(x, y, count)
 
     def trigger_click(self) -> None:
         """クリックアニメーション開始"""
         self.click_animation.trigger()
 
+    def is_idle(self) -> bool:
+        """動いているアニメーションが何もないか"""
+        return (
+            not self.popups
+            and not self.particles
+            and not self.click_animation.is_animating
+        )
+
     def update(self, dt: float) -> None:
         """更新"""
-        # ポップアップ更新
+        if self.is_idle():
+            return
+
+        # ポップアップ更新 (消えたものがあった時だけリストを作り直す)
+        died: bool = False
         for popup in self.popups:
             popup.update(dt)
-        self.popups = [p for p in self.popups if p.alive]
+            if not popup.alive:
+                died = True
+        if died:
+            self.popups = [p for p in self.popups if p.alive]
 
         # パーティクル更新
-        for particle in self.particles:
-            particle.update(dt)
-        self.particles = [p for p in self.particles if p.alive]
+        self.particles.update(dt)
 
         # クリックアニメーション更新
         self.click_animation.update(dt)
@@ -245,8 +302,7 @@ class AnimationManager:
     def draw(self, surface: pygame.Surface) -> None:
         """描画"""
         # パーティクル描画
-        for particle in self.particles:
-            particle.draw(surface)
+        self.particles.draw(surface)
 
         # ポップアップ描画
         for popup in self.popups:
@@ -4,8 +4,11 @@
 
 from __future__ import annotations
 
+import bisect
 import math
 import os
+import random
+from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 
 import pygame
@@ -15,6 +18,49 @@ from settings import AFFECTION, CHARACTERS, COLORS
 if TYPE_CHECKING:
     from player import Player
 
+    UnlockCheck = Callable[[Player, int], bool]
+
+# アイドル時の上下揺れ (振幅 3px) を 1 周期 256 分割で引く正弦テーブル
+_IDLE_BOB_LUT: list[float] = [math.sin(2 * math.pi * i / 256) * 3.0 for i in range(256)]
+_IDLE_BOB_INDEX_SCALE: float = 1.5 * 256 / (2 * math.pi)
+
+# 好感度レベルごとの下限値 (昇順)
+_LEVEL_MINS: list[float] = [lv["min"] for lv in AFFECTION["levels"]]
+assert _LEVEL_MINS == sorted(_LEVEL_MINS), "AFFECTION levels must be sorted by min"
+
+
+def _compile_unlock(cond: dict[str, Any] | None) -> UnlockCheck:
+    """解放条件を (player, 実績数) -> 解放可否 の関数に変換"""
+    if cond is None:
+        return lambda p, n: True
+    value = cond["value"]
+    ctype = cond["type"]
+    if ctype == "total_points":
+        return lambda p, n: p.total_points_earned >= value
+    if ctype == "total_clicks":
+        return lambda p, n: p.total_clicks >= value
+    if ctype == "achievements":
+        return lambda p, n: n >= value
+    return lambda p, n: False  # 未知の条件は解放不能
+
+
+# キャラごとの解放判定 (定義順、条件の種類による分岐は読み込み時に済ませる)
+_UNLOCK_CHECKS: list[tuple[str, UnlockCheck]] = [
+    (cid, _compile_unlock(info["unlock_condition"])) for cid, info in CHARACTERS.items()
+]
+
+# キラキラ配置のキャッシュ ((サイズ, 虹色) -> [(x, y, 色, 半径)])
+_SPARKLE_CACHE: dict[
+    tuple[tuple[int, int], bool], list[tuple[int, int, tuple[int, int, int], int]]
+] = {}
+
+
+def to_display_format(surface: pygame.Surface) -> pygame.Surface:
+    """画面のピクセル形式に変換 (画面がまだ無ければそのまま返す)"""
+    if pygame.display.get_surface() is None:
+        return surface
+    return surface.convert_alpha()
+
 
 class CharacterManager:
     """キャラクター管理クラス"""
@@ -22,7 +68,17 @@ class CharacterManager:
     def __init__(self) -> None:
         self.current_id: str = "hana"
         self.unlocked: list[str] = ["hana"]
+        self._unlocked_set: set[str] = {"hana"}
         self.affection: dict[str, float] = {cid: 0.0 for cid in CHARACTERS}
+        # 好感度レベルのキャッシュ (好感度が変わったキャラだけ破棄)
+        self._level_cache: dict[str, int] = {}
+        # 全キャラの好感度の最大・最小 (実績判定で毎回走査しないよう保持)
+        self._max_aff: float = 0.0
+        self._min_aff: float = 0.0
+        # 画像ファイルのキャッシュ (ファイルが無ければ None)
+        self._image_cache: dict[tuple[str, tuple[int, int]], pygame.Surface | None] = {}
+        # 描画済みキャラ画像のキャッシュ (cid, 表情, サイズ, まばたき)
+        self._surface_cache: dict[tuple[str, str, tuple[int, int], bool], pygame.Surface] = {}
         # アイドルアニメーション用
         self._idle_timer: float = 0.0
         self._blink_timer: float = 0.0
@@ -36,36 +92,39 @@ class CharacterManager:
     def check_unlocks(self, player: Player, achievement_count: int = 0) -> list[str]:
         """解放条件をチェックし、新たに解放されたキャラIDリストを返す"""
         newly: list[str] = []
-        for cid, info in CHARACTERS.items():
-            if cid in self.unlocked:
+        for cid, check in _UNLOCK_CHECKS:
+            if cid in self._unlocked_set:
                 continue
-            cond = info["unlock_condition"]
-            if cond is None:
-                if cid not in self.unlocked:
-                    self.unlocked.append(cid)
-                    newly.append(cid)
-                continue
-            unlocked = False
-            if cond["type"] == "total_points":
-                unlocked = player.total_points_earned >= cond["value"]
-            elif cond["type"] == "total_clicks":
-                unlocked = player.total_clicks >= cond["value"]
-            elif cond["type"] == "achievements":
-                unlocked = achievement_count >= cond["value"]
-            if unlocked:
-                self.unlocked.append(cid)
+            if check(player, achievement_count):
+                self._unlock(cid)
                 newly.append(cid)
         return newly
 
+    def _unlock(self, character_id: str) -> None:
+        self.unlocked.append(character_id)
+        self._unlocked_set.add(character_id)
+
+    def is_unlocked(self, character_id: str) -> bool:
+        return character_id in self._unlocked_set
+
     # ------------------------------------------------------------------
     # 好感度
     # ------------------------------------------------------------------
     def add_affection(self, amount: float, character_id: str | None = None) -> None:
         cid = character_id or self.current_id
         if cid in self.affection:
-            self.affection[cid] = min(
-                AFFECTION["max"], self.affection[cid] + amount
-            )
+            old = self.affection[cid]
+            new = min(AFFECTION["max"], old + amount)
+            self.affection[cid] = new
+            self._level_cache.pop(cid, None)
+            if new >= self._max_aff:
+                self._max_aff = new
+            elif old == self._max_aff:
+                self._max_aff = max(self.affection.values())
+            if new <= self._min_aff:
+                self._min_aff = new
+            elif old == self._min_aff:
+                self._min_aff = min(self.affection.values())
 
     def get_affection(self, character_id: str | None = None) -> float:
         cid = character_id or self.current_id
@@ -73,11 +132,13 @@ class CharacterManager:
 
     def get_affection_level(self, character_id: str | None = None) -> int:
         """好感度レベル (0-indexed) を返す"""
-        val = self.get_affection(character_id)
-        level = 0
-        for i, lv in enumerate(AFFECTION["levels"]):
-            if val >= lv["min"]:
-                level = i
+        cid = character_id or self.current_id
+        level = self._level_cache.get(cid)
+        if level is not None:
+            return level
+        val = self.get_affection(cid)
+        level = max(0, bisect.bisect_right(_LEVEL_MINS, val) - 1)
+        self._level_cache[cid] = level
         return level
 
     def get_affection_level_info(self, character_id: str | None = None) -> dict[str, Any]:
@@ -86,16 +147,29 @@ class CharacterManager:
 
     def get_max_affection(self) -> float:
         """全キャラの最大好感度を返す"""
-        return max(self.affection.values()) if self.affection else 0.0
+        return self._max_aff
+
+    def get_min_affection(self) -> float:
+        """全キャラの最小好感度を返す"""
+        return self._min_aff
 
     def all_affection_above(self, threshold: float) -> bool:
-        return all(v >= threshold for v in self.affection.values())
+        return self._min_aff >= threshold
+
+    def _refresh_affection_bounds(self) -> None:
+        values = self.affection.values()
+        self._max_aff = max(values) if self.affection else 0.0
+        self._min_aff = min(values) if self.affection else 0.0
+
+    def state_key(self) -> tuple[str, int]:
+        """見た目を決める状態 (キャラID, 好感度レベル) を返す"""
+        return (self.current_id, self.get_affection_level())
 
     # ------------------------------------------------------------------
     # キャラ切替
     # ------------------------------------------------------------------
     def switch_character(self, character_id: str) -> bool:
-        if character_id in self.unlocked:
+        if character_id in self._unlocked_set:
             self.current_id = character_id
             return True
         return False
@@ -104,31 +178,56 @@ class CharacterManager:
     # 描画
     # ------------------------------------------------------------------
     def create_character_surface(
-        self, size: tuple[int, int], character_id: str | None = None
+        self,
+        size: tuple[int, int],
+        character_id: str | None = None,
+        blink: bool = False,
     ) -> pygame.Surface:
-        """キャラクター画像を生成"""
+        """キャラクター画像を生成 (まばたき顔は blink=True の時だけ)"""
         cid = character_id or self.current_id
         info = CHARACTERS.get(cid, CHARACTERS["hana"])
 
         # 画像ファイルがあれば使う
-        image_path = f"assets/images/{cid}.png"
+        image = self._load_image(cid, size)
+        if image is not None:
+            return image
+
+        aff_level = self.get_affection_level(cid)
+        expression = AFFECTION["levels"][aff_level]["expression"]
+        blink = blink and expression not in ("sparkle", "rainbow")
+        key = (cid, expression, tuple(size), blink)
+        surface = self._surface_cache.get(key)
+        if surface is None:
+            surface = to_display_format(
+                self._draw_character(size, info["colors"], expression, blink)
+            )
+            self._surface_cache[key] = surface
+        return surface
+
+    def _load_image(
+        self, character_id: str, size: tuple[int, int]
+    ) -> pygame.Surface | None:
+        """キャラ画像を読み込む (結果はファイルの有無も含めてキャッシュ)"""
+        key = (character_id, tuple(size))
+        if key in self._image_cache:
+            return self._image_cache[key]
+        image: pygame.Surface | None = None
+        image_path = f"assets/images/{character_id}.png"
         if os.path.exists(image_path):
             try:
                 img = pygame.image.load(image_path)
-                return pygame.transform.scale(img, size)
+                image = to_display_format(pygame.transform.scale(img, size))
             except Exception:
                 pass
-
-        colors = info["colors"]
-        aff_level = self.get_affection_level(cid)
-        expression = AFFECTION["levels"][aff_level]["expression"]
-        return self._draw_character(size, colors, expression)
+        self._image_cache[key] = image
+        return image
 
     def _draw_character(
         self,
         size: tuple[int, int],
         colors: dict[str, tuple[int, int, int]],
         expression: str,
+        blink: bool = False,
     ) -> pygame.Surface:
         surface = pygame.Surface(size, pygame.SRCALPHA)
         cx, cy = size[0] // 2, size[1] // 2
@@ -152,7 +251,7 @@ class CharacterManager:
 
         eye_y = cy - 10
         eye_off = 28
-        self._draw_eyes(surface, cx, eye_y, eye_off, expression)
+        self._draw_eyes(surface, cx, eye_y, eye_off, expression, blink)
         self._draw_eyebrows(surface, cx, eye_y)
 
         # 頬
@@ -190,12 +289,17 @@ class CharacterManager:
         return surface
 
     def _draw_eyes(
-        self, surface: pygame.Surface, cx: int, eye_y: int, offset: int, expression: str
+        self,
+        surface: pygame.Surface,
+        cx: int,
+        eye_y: int,
+        offset: int,
+        expression: str,
+        blink: bool = False,
     ) -> None:
-        is_blink = self._is_blinking and expression not in ("sparkle", "rainbow")
         for d in (-1, 1):
             ex = cx + d * offset
-            if is_blink:
+            if blink:
                 pygame.draw.line(surface, COLORS["text"], (ex - 12, eye_y), (ex + 12, eye_y), 3)
                 continue
             # 白目
@@ -234,8 +338,20 @@ class CharacterManager:
         self, surface: pygame.Surface, cx: int, cy: int,
         size: tuple[int, int], rainbow: bool = False,
     ) -> None:
-        import random as _rng
-        _rng.seed(42)
+        key = (tuple(size), rainbow)
+        sparkles = _SPARKLE_CACHE.get(key)
+        if sparkles is None:
+            sparkles = self._build_sparkles(size, rainbow)
+            _SPARKLE_CACHE[key] = sparkles
+        for sx, sy, c, radius in sparkles:
+            pygame.draw.circle(surface, c, (sx, sy), radius)
+
+    @staticmethod
+    def _build_sparkles(
+        size: tuple[int, int], rainbow: bool
+    ) -> list[tuple[int, int, tuple[int, int, int], int]]:
+        """キラキラの配置を生成 (固定シードなので毎回同じ配置になる)"""
+        rng = random.Random(42)
         sparkle_colors = [
             (255, 255, 150), (255, 200, 255), (200, 255, 255), (255, 220, 180),
         ]
@@ -244,11 +360,13 @@ class CharacterManager:
                 (255, 100, 100), (255, 200, 100), (100, 255, 100),
                 (100, 200, 255), (200, 100, 255),
             ]
+        sparkles = []
         for _ in range(8):
-            sx = _rng.randint(10, size[0] - 10)
-            sy = _rng.randint(10, size[1] - 10)
-            c = _rng.choice(sparkle_colors)
-            pygame.draw.circle(surface, c, (sx, sy), _rng.randint(2, 4))
+            sx = rng.randint(10, size[0] - 10)
+            sy = rng.randint(10, size[1] - 10)
+            c = rng.choice(sparkle_colors)
+            sparkles.append((sx, sy, c, rng.randint(2, 4)))
+        return sparkles
 
     # ------------------------------------------------------------------
     # アイドルアニメーション
@@ -262,11 +380,13 @@ class CharacterManager:
         if self._is_blinking and self._blink_timer >= self._blink_duration:
             self._is_blinking = False
             self._blink_timer = 0.0
-            import random
             self._next_blink = random.uniform(2.0, 5.0)
 
     def get_idle_offset_y(self) -> float:
-        return math.sin(self._idle_timer * 1.5) * 3.0
+        return _IDLE_BOB_LUT[int(self._idle_timer * _IDLE_BOB_INDEX_SCALE) & 255]
+
+    def is_blinking(self) -> bool:
+        return self._is_blinking
 
     # ------------------------------------------------------------------
     # セーブ / ロード
@@ -281,7 +401,10 @@ class CharacterManager:
     def from_dict(self, data: dict[str, Any]) -> None:
         self.current_id = data.get("current_character", "hana")
         self.unlocked = data.get("unlocked", ["hana"])
+        self._unlocked_set = set(self.unlocked)
         saved_aff = data.get("affection", {})
         for cid in self.affection:
             if cid in saved_aff:
                 self.affection[cid] = saved_aff[cid]
+        self._level_cache.clear()
+        self._refresh_affection_bounds()
@@ -4,16 +4,38 @@
 
 from __future__ import annotations
 
+import math
 import random
 from typing import TYPE_CHECKING, Any
 
 import pygame
 
 from settings import COLORS, EVENT_CONFIG
+from ui import TextCache
 
 if TYPE_CHECKING:
     from player import Player
 
+# お花の花びら 5 枚の中心オフセット (72°刻み・半径 10px)
+_PETAL_OFFSETS: list[tuple[int, int]] = [
+    (int(math.cos(math.radians(i * 72)) * 10), int(math.sin(math.radians(i * 72)) * 10))
+    for i in range(5)
+]
+
+# イベント発生間隔 (秒)
+_INTERVAL_MIN: float = EVENT_CONFIG["min_interval"]
+_INTERVAL_SPAN: float = EVENT_CONFIG["max_interval"] - EVENT_CONFIG["min_interval"]
+
+# ターゲットの出現範囲
+_TARGET_XS: range = range(100, 801)
+_TARGET_YS: range = range(150, 551)
+
+# ターゲットの当たり判定半径 (30px) の二乗
+_HIT_RADIUS_SQ: int = 30 * 30
+
+# 発生告知バナーの背景色 (RGBA)
+_ALERT_BG_RGBA: tuple[int, int, int, int] = (*COLORS["gold"], 220)
+
 
 class RandomEvent:
     """個別イベントデータ"""
@@ -32,11 +54,28 @@ class RandomEvent:
         self.elapsed: float = 0.0
         self.active: bool = True
         self.success: bool = False
-        # イベント固有データ
-        self.targets: list[dict[str, Any]] = []
+        # イベント固有データ (ターゲットは座標の並列リスト + 生存ビットマスク)
+        self.xs: list[int] = []
+        self.ys: list[int] = []
+        self.alive_mask: int = 0  # i ビット目 = i 番目のターゲットが残っている
         self.collected: int = 0
         self.required: int = 0
 
+    def reset(self, template: dict[str, Any]) -> None:
+        """テンプレートの内容で状態を初期化し直す (オブジェクトを使い回す)"""
+        self.event_type = template["type"]
+        self.name = template["name"]
+        self.duration = template["duration"]
+        self.description = template["description"]
+        self.required = template["required"]
+        self.elapsed = 0.0
+        self.active = True
+        self.success = False
+        self.xs.clear()
+        self.ys.clear()
+        self.alive_mask = 0
+        self.collected = 0
+
     @property
     def time_remaining(self) -> float:
         return max(0.0, self.duration - self.elapsed)
@@ -90,11 +129,17 @@ class EventManager:
         self.total_completed: int = 0
         self.showing_alert: bool = False
         self._alert_timer: float = 0.0
+        self._text_cache: TextCache = TextCache()
+        # イベント種類ごとに 1 つずつ用意して使い回す
+        self._event_pool: dict[str, RandomEvent] = {
+            t["type"]: RandomEvent(t["type"], t["name"], t["duration"], t["description"])
+            for t in EVENT_TEMPLATES
+        }
+        # イベント種類 → (ターゲットのスプライト, 中心オフセット)
+        self._target_sprites: dict[str, tuple[pygame.Surface, int]] = {}
 
     def _random_interval(self) -> float:
-        return random.uniform(
-            EVENT_CONFIG["min_interval"], EVENT_CONFIG["max_interval"]
-        )
+        return _INTERVAL_MIN + random.random() * _INTERVAL_SPAN
 
     # ------------------------------------------------------------------
     # 更新
@@ -131,19 +176,14 @@ class EventManager:
 
     def _start_event(self) -> None:
         template = random.choice(EVENT_TEMPLATES)
-        ev = RandomEvent(
-            template["type"], template["name"],
-            template["duration"], template["description"],
-        )
-        ev.required = template["required"]
+        ev = self._event_pool[template["type"]]
+        ev.reset(template)
 
         if ev.event_type in ("shooting_star", "flower_field", "rainbow_visitor"):
-            for _ in range(ev.required):
-                ev.targets.append({
-                    "x": random.randint(100, 800),
-                    "y": random.randint(150, 550),
-                    "alive": True,
-                })
+            n = ev.required
+            ev.xs.extend(random.choices(_TARGET_XS, k=n))
+            ev.ys.extend(random.choices(_TARGET_YS, k=n))
+            ev.alive_mask = (1 << n) - 1
         self.current_event = ev
 
     def _finish_event(self) -> dict[str, Any]:
@@ -172,13 +212,16 @@ class EventManager:
         ev = self.current_event
         if ev.event_type == "gold_rush":
             return False  # クリックは通常クリック側で倍率処理
-        for t in ev.targets:
-            if not t["alive"]:
-                continue
-            dx = pos[0] - t["x"]
-            dy = pos[1] - t["y"]
-            if dx * dx + dy * dy < 30 * 30:
-                t["alive"] = False
+        px, py = pos
+        mask = ev.alive_mask  # 全ターゲット回収済みなら 0 で即終了
+        while mask:
+            low = mask & -mask
+            i = low.bit_length() - 1
+            mask ^= low
+            dx = px - ev.xs[i]
+            dy = py - ev.ys[i]
+            if dx * dx + dy * dy < _HIT_RADIUS_SQ:
+                ev.alive_mask &= ~low
                 ev.collected += 1
                 if ev.collected >= ev.required:
                     ev.success = True
@@ -205,6 +248,10 @@ class EventManager:
     # ------------------------------------------------------------------
     # 描画
     # ------------------------------------------------------------------
+    def is_active(self) -> bool:
+        """アラートかイベントを表示中か"""
+        return self.showing_alert or self.current_event is not None
+
     def draw(self, surface: pygame.Surface, fonts: dict[str, pygame.font.Font]) -> None:
         if self.showing_alert:
             self._draw_alert(surface, fonts)
@@ -214,9 +261,11 @@ class EventManager:
     def _draw_alert(self, surface: pygame.Surface, fonts: dict[str, pygame.font.Font]) -> None:
         # 画面上部にバナー
         banner = pygame.Rect(340, 80, 600, 50)
-        pygame.draw.rect(surface, (*COLORS["gold"], 220), banner, border_radius=12)
+        pygame.draw.rect(surface, _ALERT_BG_RGBA, banner, border_radius=12)
         pygame.draw.rect(surface, COLORS["text"], banner, 2, border_radius=12)
-        text = fonts["medium"].render("！イベント発生！ クリックで開始", True, COLORS["text"])
+        text = self._text_cache.render(
+            fonts["medium"], "！イベント発生！ クリックで開始", COLORS["text"]
+        )
         tr = text.get_rect(center=banner.center)
         surface.blit(text, tr)
 
@@ -227,11 +276,11 @@ class EventManager:
 
         # イベント名 + 残り時間
         info_text = f"{ev.name}  残り {ev.time_remaining:.1f}秒"
-        info_surf = fonts["medium"].render(info_text, True, COLORS["gold"])
+        info_surf = self._text_cache.render(fonts["medium"], info_text, COLORS["gold"])
         surface.blit(info_surf, (340, 85))
 
         # 説明
-        desc_surf = fonts["small"].render(ev.description, True, COLORS["text"])
+        desc_surf = self._text_cache.render(fonts["small"], ev.description, COLORS["text"])
         surface.blit(desc_surf, (340, 115))
 
         # 進捗バー (収集系)
@@ -242,38 +291,54 @@ class EventManager:
             if filled_w > 0:
                 bar_fill = pygame.Rect(340, 138, filled_w, 12)
                 pygame.draw.rect(surface, COLORS["gold"], bar_fill, border_radius=6)
-            prog_text = fonts["small"].render(f"{ev.collected}/{ev.required}", True, COLORS["text"])
+            prog_text = self._text_cache.render(
+                fonts["small"], f"{ev.collected}/{ev.required}", COLORS["text"]
+            )
             surface.blit(prog_text, (548, 134))
 
-        # ターゲット描画
-        if ev.event_type == "shooting_star":
-            for t in ev.targets:
-                if t["alive"]:
-                    pygame.draw.circle(surface, (255, 255, 150), (t["x"], t["y"]), 15)
-                    pygame.draw.circle(surface, COLORS["gold"], (t["x"], t["y"]), 10)
-                    pygame.draw.circle(surface, COLORS["white"], (t["x"] - 3, t["y"] - 3), 4)
-        elif ev.event_type == "flower_field":
-            for t in ev.targets:
-                if t["alive"]:
-                    # 花びら
-                    for angle_offset in range(5):
-                        import math
-                        a = math.radians(angle_offset * 72)
-                        px = t["x"] + int(math.cos(a) * 10)
-                        py = t["y"] + int(math.sin(a) * 10)
-                        pygame.draw.circle(surface, (255, 180, 200), (px, py), 8)
-                    pygame.draw.circle(surface, (255, 230, 100), (t["x"], t["y"]), 6)
-        elif ev.event_type == "rainbow_visitor":
-            for t in ev.targets:
-                if t["alive"]:
-                    # シルエット (丸い影)
-                    silhouette = pygame.Surface((60, 60), pygame.SRCALPHA)
-                    pygame.draw.circle(silhouette, (100, 80, 150, 180), (30, 30), 28)
-                    pygame.draw.circle(silhouette, (150, 130, 200, 200), (30, 25), 16)
-                    text = fonts["small"].render("？", True, COLORS["white"])
-                    tr = text.get_rect(center=(30, 30))
-                    silhouette.blit(text, tr)
-                    surface.blit(silhouette, (t["x"] - 30, t["y"] - 30))
+        # ターゲット描画 (種類ごとに描画済みのスプライトを貼るだけ)
+        mask = ev.alive_mask
+        if mask:
+            sprite, half = self._get_target_sprite(ev.event_type, fonts)
+            while mask:
+                low = mask & -mask
+                i = low.bit_length() - 1
+                mask ^= low
+                surface.blit(sprite, (ev.xs[i] - half, ev.ys[i] - half))
+
+    def _get_target_sprite(
+        self, event_type: str, fonts: dict[str, pygame.font.Font]
+    ) -> tuple[pygame.Surface, int]:
+        """ターゲットのスプライトと中心までのオフセットを返す (初回のみ描画)"""
+        cached = self._target_sprites.get(event_type)
+        if cached is not None:
+            return cached
+
+        if event_type == "shooting_star":
+            half = 15
+            sprite = pygame.Surface((half * 2 + 1, half * 2 + 1), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, (255, 255, 150), (half, half), 15)
+            pygame.draw.circle(sprite, COLORS["gold"], (half, half), 10)
+            pygame.draw.circle(sprite, COLORS["white"], (half - 3, half - 3), 4)
+        elif event_type == "flower_field":
+            half = 18
+            sprite = pygame.Surface((half * 2 + 1, half * 2 + 1), pygame.SRCALPHA)
+            # 花びら
+            for dx, dy in _PETAL_OFFSETS:
+                pygame.draw.circle(sprite, (255, 180, 200), (half + dx, half + dy), 8)
+            pygame.draw.circle(sprite, (255, 230, 100), (half, half), 6)
+        else:
+            # rainbow_visitor: シルエット (丸い影)
+            half = 30
+            sprite = pygame.Surface((60, 60), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, (100, 80, 150, 180), (30, 30), 28)
+            pygame.draw.circle(sprite, (150, 130, 200, 200), (30, 25), 16)
+            text = fonts["small"].render("？", True, COLORS["white"])
+            tr = text.get_rect(center=(30, 30))
+            sprite.blit(text, tr)
+
+        self._target_sprites[event_type] = (sprite, half)
+        return sprite, half
 
     # ------------------------------------------------------------------
     # セーブ / ロード
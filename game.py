@@ -4,7 +4,9 @@
 
 from __future__ import annotations
 
+import io
 import os
+from collections.abc import Callable
 from datetime import datetime
 from typing import Any
 
@@ -18,6 +20,7 @@ from player import Player
 from save_manager import SaveManager
 from settings import (
     AFFECTION,
+    AUTO_EARN_TICK,
     AUTO_SAVE_INTERVAL,
     CHARACTER,
     COLORS,
@@ -33,10 +36,21 @@ from ui import (
     Button,
     CharacterSelectPanel,
     SettingsPanel,
+    TextCache,
     ToastNotification,
     UpgradePanel,
 )
 
+# 日本語フォント (見つかった最初のものを使う)
+_FONT_CANDIDATES: tuple[str, ...] = (
+    "assets/fonts/NotoSansCJKjp-Regular.otf",
+    "assets/fonts/NotoSansJP-Regular.ttf",
+    "assets/fonts/mplus-1p-regular.ttf",
+)
+_FONT_PATH: str | None = next((p for p in _FONT_CANDIDATES if os.path.exists(p)), None)
+# よく出るクリック獲得ポイントのポップアップ文字列 (+0 ~ +63)
+_CLICK_POPUP_TEXTS: tuple[str, ...] = tuple(f"+{n}" for n in range(64))
+
 
 class Game:
     """ゲームメインクラス"""
@@ -48,6 +62,30 @@ class Game:
 
         # フォント初期化
         self.fonts: dict[str, pygame.font.Font] = self._load_fonts()
+        self.text_cache: TextCache = TextCache()
+        # ポイント表示用の数字グリフ (毎フレーム変わる数値を文字単位で組み立てる)
+        self._digit_surfs: dict[str, pygame.Surface] = {
+            ch: self.fonts["xlarge"].render(ch, True, COLORS["text"]) for ch in "0123456789,"
+        }
+        self._digit_w: dict[str, int] = {
+            ch: surf.get_width() for ch, surf in self._digit_surfs.items()
+        }
+        self._digit_h: int = max(surf.get_height() for surf in self._digit_surfs.values())
+        self._points_label: pygame.Surface = self.fonts["small"].render(
+            "ポイント", True, COLORS["text_light"]
+        )
+        # ポイント表示の背景 (角丸矩形は一度だけ描いておく)
+        self._points_bg: pygame.Surface = pygame.Surface((300, 70), pygame.SRCALPHA)
+        pygame.draw.rect(
+            self._points_bg, COLORS["white"], self._points_bg.get_rect(), border_radius=15
+        )
+        # HUD の組み立て済みサーフェス (表示内容が変わった時だけ作り直す)
+        self._points_key: int | None = None
+        self._points_surface: pygame.Surface | None = None
+        self._points_pos: tuple[int, int] = (0, 0)
+        self._stats_key: tuple[int, float] | None = None
+        self._stats_surface: pygame.Surface | None = None
+        self._base_blits: list[tuple[pygame.Surface, Any]] = []
 
         # コンポーネント初期化
         self.player: Player = Player()
@@ -68,12 +106,42 @@ class Game:
             CHARACTER["size"][0],
             CHARACTER["size"][1],
         )
-        self._refresh_character_image()
+        # 毎フレーム参照するレイアウト値 (位置は固定なので一度だけ求める)
+        self._char_w, self._char_h = CHARACTER["size"]
+        self._char_center: tuple[int, int] = self.character_rect.center
+        self._char_topleft: tuple[int, int] = self.character_rect.topleft
+        # クリック判定用の境界 (collidepoint と同じく右端・下端は含まない)
+        self._char_x1, self._char_y1 = self.character_rect.topleft
+        self._char_x2, self._char_y2 = self.character_rect.bottomright
+        self._aff_bar_pos: tuple[int, int] = (
+            self.character_rect.centerx, self.character_rect.bottom + 10
+        )
+        # アイドル揺れ (±3px) で描き変わる範囲
+        self._char_area: pygame.Rect = self.character_rect.inflate(0, 8)
+        # クリック時の伸縮画像キャッシュ (サイズ → 拡縮済み画像、画像更新で破棄)
+        self._char_scaled: dict[tuple[int, int, bool], pygame.Surface] = {}
+        # キャラ画像は最初に描画する時に生成する
+        self.character_image: pygame.Surface | None = None
+        self._character_state: tuple[str, int] | None = None
 
         # ゲーム状態
         self.auto_save_timer: float = 0.0
-        self.auto_earn_accumulator: float = 0.0
+        # 自動収益の予定時刻 (ゲーム内経過時間で管理)
+        self._game_time: float = 0.0
+        self._next_auto_time: float = 0.0
         self.settings_open: bool = False
+        # 描き直しが必要か (main ループが描画後に False に戻す)
+        self.dirty: bool = True
+        # 描き直す範囲 (空なら画面全体、main ループが描画後に空に戻す)
+        self.dirty_rects: list[pygame.Rect] = []
+        self._was_active: bool = False
+        self._last_view: tuple[int, int, bool] = (-1, 0, False)
+        # ポイント表示の帯 (横幅は桁数で変わるので画面幅いっぱいに取る)
+        self._points_band: pygame.Rect = screen.get_rect()
+        # 開いているモーダルパネルとそのイベント処理 (panel, handler)
+        self._active_modal: tuple[Any, Callable[[pygame.event.Event], Any]] | None = None
+        # 直近のマウス位置にあるホバー対象 (変化がなければホバー処理を省く)
+        self._hover_target: Any = None
 
         # セーブデータ読み込み
         self._load_game()
@@ -87,26 +155,30 @@ class Game:
     def _load_fonts(self) -> dict[str, pygame.font.Font]:
         """フォントを読み込み"""
         fonts: dict[str, pygame.font.Font] = {}
-        font_paths: list[str] = [
-            "assets/fonts/NotoSansCJKjp-Regular.otf",
-            "assets/fonts/NotoSansJP-Regular.ttf",
-            "assets/fonts/mplus-1p-regular.ttf",
-        ]
-        font_path: str | None = None
-        for path in font_paths:
-            if os.path.exists(path):
-                font_path = path
-                break
-        for size_name, size in FONT_SIZES.items():
+        font_data: bytes | None = None
+        if _FONT_PATH:
             try:
-                if font_path:
-                    fonts[size_name] = pygame.font.Font(font_path, size)
-                else:
+                # フォントファイルは一度だけ読み込み、サイズごとにメモリから開く
+                with open(_FONT_PATH, "rb") as f:
+                    font_data = f.read()
+            except OSError as e:
+                print(f"フォント読み込みエラー: {e}")
+        try:
+            if font_data is not None:
+                for size_name, size in FONT_SIZES.items():
+                    fonts[size_name] = pygame.font.Font(io.BytesIO(font_data), size)
+            else:
+                for size_name, size in FONT_SIZES.items():
                     fonts[size_name] = pygame.font.SysFont(
                         "notosanscjkjp,meiryoui,msgothic", size
                     )
-            except Exception:
-                fonts[size_name] = pygame.font.Font(None, size)
+        except Exception as e:
+            # どれか一つでも失敗したら全サイズをデフォルトフォントに揃える
+            print(f"フォント初期化エラー: {e}")
+            fonts = {
+                size_name: pygame.font.Font(None, size)
+                for size_name, size in FONT_SIZES.items()
+            }
         return fonts
 
     def _init_ui(self) -> None:
@@ -141,6 +213,10 @@ class Game:
             COLORS["success"], COLORS["primary"],
         )
 
+        self._header_buttons: tuple[Button, ...] = (
+            self.settings_button, self.char_button, self.achievement_button,
+        )
+
         # パネル類
         self.settings_panel: SettingsPanel = SettingsPanel(
             SCREEN_WIDTH, SCREEN_HEIGHT, self.fonts,
@@ -159,21 +235,33 @@ class Game:
         self.toast: ToastNotification = ToastNotification(self.fonts)
 
     def _refresh_character_image(self) -> None:
-        """現在のキャラクターで画像を再生成"""
-        self.character_image: pygame.Surface = self.char_mgr.create_character_surface(
-            CHARACTER["size"]
-        )
+        """キャラ・好感度レベルが変わっていれば画像を破棄 (次の描画で再生成)"""
+        state: tuple[str, int] = self.char_mgr.state_key()
+        if state == self._character_state:
+            return
+        self._character_state = state
+        self.character_image = None
+        self._char_scaled.clear()
+
+    def _ensure_character_image(self) -> pygame.Surface:
+        """キャラ画像を返す (未生成なら現在の状態で生成)"""
+        if self.character_image is None:
+            self._character_state = self.char_mgr.state_key()
+            # キャッシュする画像は目を開けた顔 (まばたき中に作っても閉じ目が残らない)
+            self.character_image = self.char_mgr.create_character_surface(
+                CHARACTER["size"], blink=False,
+            )
+        return self.character_image
 
     def _load_sounds(self) -> None:
-        """サウンドを読み込み"""
-        self.sound_manager.load_all_sounds()
-        bgm_path: str = "assets/music/bgm.wav"
-        if self.sound_manager.load_bgm(bgm_path):
-            self.sound_manager.play_bgm()
+        """サウンドをバックグラウンドで読み込み (最初の描画を待たせない)"""
+        self.sound_manager.load_all_sounds_async(bgm_path="assets/music/bgm.wav")
 
     def _load_game(self) -> None:
         """ゲームデータを読み込み"""
         data: dict[str, Any] | None = self.save_manager.load()
+        # デイリーログイン判定で再利用するため保持しておく
+        self._loaded_save_data: dict[str, Any] | None = data
         if data:
             if "player" in data:
                 self.player.from_dict(data["player"])
@@ -194,7 +282,7 @@ class Game:
             # オフライン収益
             if "last_played" in data:
                 offline_earnings: float = self.save_manager.calculate_offline_earnings(
-                    self.player, data["last_played"]
+                    self.player, data["last_played"], data.get("last_played_ts")
                 )
                 if offline_earnings > 0:
                     self.player.add_points(offline_earnings)
@@ -207,8 +295,8 @@ class Game:
         # キャラ画像を最新状態で再生成
         self._refresh_character_image()
 
-    def _save_game(self) -> None:
-        """ゲームデータを保存"""
+    def _save_game(self, background: bool = False) -> None:
+        """ゲームデータを保存 (background=True なら書き込みは別スレッド)"""
         settings: dict[str, float] = {
             "bgm_volume": self.sound_manager.get_bgm_volume(),
             "sfx_volume": self.sound_manager.get_sfx_volume(),
@@ -218,12 +306,16 @@ class Game:
             "achievements": self.achievement_mgr.to_dict(),
             "events": self.event_mgr.to_dict(),
         }
-        self.save_manager.save(self.player, settings, extra)
+        if background:
+            self.save_manager.save_async(self.player, settings, extra)
+        else:
+            self.save_manager.save(self.player, settings, extra)
 
     def _check_daily_login(self) -> None:
         """デイリーログイン好感度"""
-        data = self.save_manager.load()
-        today = datetime.now().strftime("%Y-%m-%d")
+        data = self._loaded_save_data
+        del self._loaded_save_data
+        today = datetime.now().date().isoformat()
         last_login = ""
         if data:
             last_login = data.get("daily_login", "")
@@ -236,47 +328,56 @@ class Game:
     # ------------------------------------------------------------------
     def handle_event(self, event: pygame.event.Event) -> None:
         """イベント処理"""
-        # モーダルパネルが開いている場合
-        if self.settings_panel.is_visible:
-            result: dict[str, Any] | None = self.settings_panel.handle_event(event)
-            if result:
-                if "bgm_volume" in result:
-                    self.sound_manager.set_bgm_volume(result["bgm_volume"])
-                if "sfx_volume" in result:
-                    self.sound_manager.set_sfx_volume(result["sfx_volume"])
+        etype: int = event.type
+        # モーダルパネルが開いている場合はそのパネルだけに渡す
+        if self._active_modal is not None:
+            self.dirty = True
+            panel, handler = self._active_modal
+            handler(event)
+            if not panel.is_visible:
+                self._active_modal = None
             return
 
-        if self.char_select_panel.is_visible:
-            selected = self.char_select_panel.handle_event(event, self.char_mgr)
-            if selected:
-                self.char_mgr.switch_character(selected)
-                self._refresh_character_image()
+        # マウス移動はホバー対象が変わった時だけ処理する
+        if etype == pygame.MOUSEMOTION:
+            if self._handle_hover(event):
+                self.dirty = True
             return
 
-        if self.achievement_panel.is_visible:
-            self.achievement_panel.handle_event(event)
+        # 入力があったフレームは描き直す (パネル操作・ウィンドウ再描画など)
+        self.dirty = True
+
+        # キャラクタークリックの近道 (キャラ位置はボタン・パネルと重ならない)
+        if (
+            etype == pygame.MOUSEBUTTONDOWN
+            and event.button == 1
+            and self.event_mgr.current_event is None
+            and not self.event_mgr.showing_alert
+            and self._is_on_character(event.pos)
+        ):
+            self._on_character_click(event.pos)
             return
 
         # ヘッダーボタン
         if self.settings_button.handle_event(event):
-            self.settings_panel.show()
+            self._open_modal(self.settings_panel, self._handle_settings_event)
             return
         if self.char_button.handle_event(event):
-            self.char_select_panel.show()
+            self._open_modal(self.char_select_panel, self._handle_char_select_event)
             return
         if self.achievement_button.handle_event(event):
-            self.achievement_panel.show()
+            self._open_modal(self.achievement_panel, self.achievement_panel.handle_event)
             return
 
         # イベントアラートクリック
         if self.event_mgr.showing_alert:
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            if etype == pygame.MOUSEBUTTONDOWN and event.button == 1:
                 self.event_mgr.dismiss_alert()
                 return
 
         # イベント中のターゲットクリック
         if self.event_mgr.current_event is not None:
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            if etype == pygame.MOUSEBUTTONDOWN and event.button == 1:
                 if self.event_mgr.handle_click(event.pos):
                     self.sound_manager.play_sound("click")
                     self.animation_manager.add_particles(event.pos[0], event.pos[1], 8)
@@ -286,7 +387,10 @@ class Game:
         if self.event_mgr.current_event is None:
             upgrade_id: str | None = self.upgrade_panel.handle_event(event, self.player)
             if upgrade_id:
+                # 購入前の経過分は Player が変更前の毎秒収益で精算する
                 if self.player.purchase_upgrade(upgrade_id):
+                    # 毎秒収益が変わるので次のフレームで加算予定を立て直す
+                    self._next_auto_time = self._game_time
                     self.sound_manager.play_sound("upgrade")
                     self.char_mgr.add_affection(AFFECTION["gains"]["upgrade"])
                     self.animation_manager.add_particles(
@@ -297,50 +401,101 @@ class Game:
                 return
 
         # キャラクタークリック
-        if event.type == pygame.MOUSEBUTTONDOWN:
+        if etype == pygame.MOUSEBUTTONDOWN:
             if event.button == 1:
-                if self.character_rect.collidepoint(event.pos):
+                if self._is_on_character(event.pos):
                     self._on_character_click(event.pos)
 
+    def _open_modal(self, panel: Any, handler: Callable[[pygame.event.Event], Any]) -> None:
+        """モーダルパネルを開き、以降のイベントの送り先にする"""
+        panel.show()
+        self._active_modal = (panel, handler)
+
+    def _handle_settings_event(self, event: pygame.event.Event) -> None:
+        """設定パネルのイベント処理"""
+        result: dict[str, Any] | None = self.settings_panel.handle_event(event)
+        if result:
+            if "bgm_volume" in result:
+                self.sound_manager.set_bgm_volume(result["bgm_volume"])
+            if "sfx_volume" in result:
+                self.sound_manager.set_sfx_volume(result["sfx_volume"])
+
+    def _handle_char_select_event(self, event: pygame.event.Event) -> None:
+        """キャラ選択パネルのイベント処理"""
+        selected = self.char_select_panel.handle_event(event, self.char_mgr)
+        if selected:
+            self.char_mgr.switch_character(selected)
+            self._refresh_character_image()
+
+    def _handle_hover(self, event: pygame.event.Event) -> bool:
+        """マウス移動時のホバー状態更新 - ホバー対象が変わったらTrueを返す"""
+        target: Any = self._hover_target_at(event.pos)
+        if target is self._hover_target:
+            return False
+        self._hover_target = target
+        for button in self._header_buttons:
+            button.handle_event(event)
+        # アップグレードパネル (イベント中は操作不可)
+        if self.event_mgr.current_event is None:
+            self.upgrade_panel.handle_event(event, self.player)
+        return True
+
+    def _hover_target_at(self, pos: tuple[int, int]) -> Any:
+        """指定位置にあるホバー可能なボタンを返す"""
+        for button in self._header_buttons:
+            if button.rect.collidepoint(pos):
+                return button
+        if self.event_mgr.current_event is None and self.upgrade_panel.rect.collidepoint(pos):
+            return self.upgrade_panel.button_at(pos)
+        return None
+
+    def _is_on_character(self, pos: tuple[int, int]) -> bool:
+        """キャラクターの矩形内か (固定矩形なので整数比較だけで判定)"""
+        x, y = pos
+        return self._char_x1 <= x < self._char_x2 and self._char_y1 <= y < self._char_y2
+
     def _on_character_click(self, pos: tuple[int, int]) -> None:
         """キャラクタークリック時の処理"""
+        x, y = pos
+        anim: AnimationManager = self.animation_manager
+        sound: SoundManager = self.sound_manager
+        char_mgr: CharacterManager = self.char_mgr
         multiplier = self.event_mgr.get_click_multiplier()
         points, lucky = self.player.click(multiplier)
 
         # 好感度
-        self.char_mgr.add_affection(AFFECTION["gains"]["click"])
+        char_mgr.add_affection(AFFECTION["gains"]["click"])
 
         # ラッキー実績
         if lucky:
             self.achievement_mgr.mark_lucky()
 
         # サウンド
-        self.sound_manager.play_sound("click")
+        sound.play_sound("click")
 
         # アニメーション
-        self.animation_manager.trigger_click()
+        anim.trigger_click()
 
         # 好感度レベルに応じたエフェクト
-        aff_level = self.char_mgr.get_affection_level()
+        aff_level = char_mgr.get_affection_level()
         popup_color = COLORS["gold"]
         if multiplier > 1:
             popup_color = (255, 100, 100)
-        self.animation_manager.add_popup(
-            f"+{points}", pos[0], pos[1] - 30,
-            self.fonts["medium"], popup_color,
+        text: str = (
+            _CLICK_POPUP_TEXTS[points] if points < len(_CLICK_POPUP_TEXTS) else f"+{points}"
         )
+        anim.add_popup(text, x, y - 30, self.fonts["medium"], popup_color)
 
         if aff_level >= 2:
             # ハートパーティクル
-            self.animation_manager.add_particles(pos[0], pos[1], 5)
+            anim.add_particles(x, y, 5)
         if aff_level >= 3:
-            self.animation_manager.add_particles(pos[0], pos[1] - 20, 8)
+            anim.add_particles(x, y - 20, 8)
 
-        # ボーナス時
-        base_power = self.player.get_click_power() * multiplier
-        if points > base_power:
-            self.sound_manager.play_sound("bonus")
-            self.animation_manager.add_particles(pos[0], pos[1], 20)
+        # ボーナス時 (ラッキー発動時だけ基本値を上回る)
+        if lucky:
+            sound.play_sound("bonus")
+            anim.add_particles(x, y, 20)
 
         # キャラ画像更新 (表情変化の反映)
         self._refresh_character_image()
@@ -351,23 +506,21 @@ class Game:
     # ------------------------------------------------------------------
     def update(self, dt: float) -> None:
         """更新"""
-        # アニメーション更新
+        # アニメーション更新 (何も動いていなければ update 側ですぐ戻る)
         self.animation_manager.update(dt)
 
         # キャラアイドルアニメーション
         self.char_mgr.update_idle(dt)
 
         # トースト通知
-        self.toast.update(dt)
+        if not self.toast.is_idle():
+            self.toast.update(dt)
 
-        # 自動収益
-        auto_rate: float = self.player.get_auto_rate()
-        if auto_rate > 0:
-            self.auto_earn_accumulator += auto_rate * dt
-            if self.auto_earn_accumulator >= 1.0:
-                earned: int = int(self.auto_earn_accumulator)
-                self.player.add_points(earned)
-                self.auto_earn_accumulator -= earned
+        # 自動収益 (予定時刻になった時だけ加算)
+        self._game_time += dt
+        self.player.advance(dt)
+        if self._game_time >= self._next_auto_time:
+            self._accrue_auto_earn()
 
         # ランダムイベント更新
         event_result = self.event_mgr.update(dt)
@@ -386,9 +539,51 @@ class Game:
         # オートセーブ
         self.auto_save_timer += dt
         if self.auto_save_timer >= AUTO_SAVE_INTERVAL:
-            self._save_game()
+            self._save_game(background=True)
             self.auto_save_timer = 0.0
 
+        self._update_dirty()
+
+    def _accrue_auto_earn(self) -> None:
+        """前回からの自動収益を加算し、次の加算予定時刻を決める"""
+        now: float = self._game_time
+        self.player.tick()
+        # 次に1ポイント以上たまる時刻まで待つ (最短 AUTO_EARN_TICK 秒)
+        # 毎秒収益が 0 なら予定なし (購入時に再予約)
+        self._next_auto_time = now + max(
+            AUTO_EARN_TICK, self.player.seconds_to_next_auto_point()
+        )
+
+    def _update_dirty(self) -> None:
+        """画面に変化があるか判定し、あれば dirty を立てる"""
+        # 動いているものがあるか (止まった直後のフレームも消し込みのため描く)
+        active: bool = (
+            not self.animation_manager.is_idle()
+            or not self.toast.is_idle()
+            or self.event_mgr.is_active()
+        )
+        # ポイント表示・アイドル揺れ・まばたきの表示が変わったか
+        view: tuple[int, int, bool] = (
+            int(self.player.points),
+            int(self.char_mgr.get_idle_offset_y()),
+            self.char_mgr.is_blinking(),
+        )
+        last: tuple[int, int, bool] = self._last_view
+        if active or self._was_active:
+            self.dirty = True
+        elif view != last and not self.dirty:
+            self.dirty = True
+            # モーダルが無ければ変わった部分だけ描き直す
+            # (ポイントが変わると購入可否も変わるのでアップグレードパネルも含める)
+            if self._active_modal is None:
+                if view[0] != last[0]:
+                    self.dirty_rects.append(self._points_band)
+                    self.dirty_rects.append(self.upgrade_panel.rect)
+                if view[1] != last[1] or view[2] != last[2]:
+                    self.dirty_rects.append(self._char_area)
+        self._was_active = active
+        self._last_view = view
+
     def _on_event_finished(self, result: dict[str, Any]) -> None:
         """イベント完了時処理"""
         self.achievement_mgr.mark_event()
@@ -426,22 +621,22 @@ class Game:
     # ------------------------------------------------------------------
     def draw(self, screen: pygame.Surface) -> None:
         """描画"""
+        # 下層 (キャラ・好感度バー・ポイント・ステータス) は 1 回の blits でまとめて描く
+        blits = self._base_blits
         # キャラクター描画
-        self._draw_character(screen)
+        self._draw_character(blits)
 
         # 好感度バー
-        self.affection_bar.draw(
-            screen,
-            self.character_rect.centerx,
-            self.character_rect.bottom + 10,
-            self.char_mgr,
-        )
+        blits.append(self.affection_bar.get_blit(*self._aff_bar_pos, self.char_mgr))
 
         # ポイント表示
-        self._draw_points(screen)
+        self._draw_points(blits)
 
         # ステータス表示
-        self._draw_stats(screen)
+        self._draw_stats(blits)
+
+        screen.blits(blits, doreturn=False)
+        blits.clear()
 
         # アップグレードパネル
         self.upgrade_panel.draw(screen, self.player)
@@ -452,80 +647,118 @@ class Game:
         self.achievement_button.draw(screen)
 
         # ランダムイベント
-        self.event_mgr.draw(screen, self.fonts)
+        if self.event_mgr.is_active():
+            self.event_mgr.draw(screen, self.fonts)
 
         # アニメーション
         self.animation_manager.draw(screen)
 
         # トースト通知
-        self.toast.draw(screen)
+        if not self.toast.is_idle():
+            self.toast.draw(screen)
 
         # モーダルパネル（最前面）
-        self.settings_panel.draw(screen)
-        self.char_select_panel.draw(screen, self.char_mgr)
-        self.achievement_panel.draw(
-            screen,
-            self.achievement_mgr.unlocked,
-            self.player,
-            self.char_mgr,
-        )
+        if self.settings_panel.is_visible:
+            self.settings_panel.draw(screen)
+        if self.char_select_panel.is_visible:
+            self.char_select_panel.draw(screen, self.char_mgr)
+        if self.achievement_panel.is_visible:
+            self.achievement_panel.draw(
+                screen,
+                self.achievement_mgr.unlocked,
+                self.player,
+                self.char_mgr,
+            )
 
-    def _draw_character(self, screen: pygame.Surface) -> None:
-        """キャラクター描画"""
+    def _draw_character(self, blits: list[tuple[pygame.Surface, Any]]) -> None:
+        """キャラクター描画 (blit 対象をリストに積む)"""
         scale_x, scale_y = self.animation_manager.get_click_scale()
-        idle_y = self.char_mgr.get_idle_offset_y()
-
-        img = self.character_image
-        if scale_x != 1.0 or scale_y != 1.0:
-            scaled_size: tuple[int, int] = (
-                int(CHARACTER["size"][0] * scale_x),
-                int(CHARACTER["size"][1] * scale_y),
+        idle_y = int(self.char_mgr.get_idle_offset_y())
+
+        base: pygame.Surface = self._ensure_character_image()
+        blink: bool = self.char_mgr.is_blinking()
+        if blink:
+            # まばたき中だけキャッシュ済みの閉じ目の顔に差し替える
+            base = self.char_mgr.create_character_surface(CHARACTER["size"], blink=True)
+        img = base
+        if abs(scale_x - 1.0) >= 0.01 or abs(scale_y - 1.0) >= 0.01:
+            # 2px 単位に丸めたサイズごとに拡縮済みの画像を使い回す
+            scaled_key: tuple[int, int, bool] = (
+                int(self._char_w * scale_x) & ~1,
+                int(self._char_h * scale_y) & ~1,
+                blink,
             )
-            img = pygame.transform.scale(self.character_image, scaled_size)
-            rect: pygame.Rect = img.get_rect(
-                center=(self.character_rect.centerx, self.character_rect.centery + int(idle_y))
-            )
-            screen.blit(img, rect)
+            img = self._char_scaled.get(scaled_key)
+            if img is None:
+                img = pygame.transform.scale(base, scaled_key[:2])
+                self._char_scaled[scaled_key] = img
+            cx, cy = self._char_center
+            rect: pygame.Rect = img.get_rect(center=(cx, cy + idle_y))
+            blits.append((img, rect))
         else:
-            screen.blit(
-                img,
-                (self.character_rect.x, self.character_rect.y + int(idle_y)),
+            x, y = self._char_topleft
+            blits.append((img, (x, y + idle_y)))
+
+    def _draw_points(self, blits: list[tuple[pygame.Surface, Any]]) -> None:
+        """ポイント表示 (表示値が変わった時だけ組み直す)"""
+        points: int = int(self.player.points)
+        if points != self._points_key:
+            # 表示値が変わった時だけ桁区切りの文字列を作る
+            self._points_key = points
+            self._points_surface, self._points_pos = self._build_points(f"{points:,}")
+            self._points_band = pygame.Rect(
+                0, self._points_pos[1], self.screen.get_width(), self._points_surface.get_height()
             )
+        blits.append((self._points_surface, self._points_pos))
 
-    def _draw_points(self, screen: pygame.Surface) -> None:
-        """ポイント表示"""
+    def _build_points(self, points_text: str) -> tuple[pygame.Surface, tuple[int, int]]:
+        """ポイント表示 (背景・数値・ラベル) を 1 枚に描画"""
         pos: tuple[int, int] = UI_LAYOUT["points_display"]
-        bg_rect: pygame.Rect = pygame.Rect(pos[0] - 150, pos[1] - 30, 300, 70)
-        pygame.draw.rect(screen, (*COLORS["white"], 200), bg_rect, border_radius=15)
-
-        points_text: str = f"{int(self.player.points):,}"
-        points_surface: pygame.Surface = self.fonts["xlarge"].render(
-            points_text, True, COLORS["text"]
-        )
-        points_rect: pygame.Rect = points_surface.get_rect(center=(pos[0], pos[1]))
-        screen.blit(points_surface, points_rect)
-
-        label_surface: pygame.Surface = self.fonts["small"].render(
-            "ポイント", True, COLORS["text_light"]
-        )
+        bg_rect: pygame.Rect = self._points_bg.get_rect(topleft=(pos[0] - 150, pos[1] - 30))
+        digit_w = self._digit_w
+        total_w: int = sum(digit_w[ch] for ch in points_text)
+        x: int = pos[0] - total_w // 2
+        y: int = pos[1] - self._digit_h // 2
+        digits_rect: pygame.Rect = pygame.Rect(x, y, total_w, self._digit_h)
+        label_surface: pygame.Surface = self._points_label
         label_rect: pygame.Rect = label_surface.get_rect(center=(pos[0], pos[1] + 30))
-        screen.blit(label_surface, label_rect)
-
-    def _draw_stats(self, screen: pygame.Surface) -> None:
-        """ステータス表示"""
-        stats: list[str] = [
-            f"クリック: +{self.player.get_click_power()}/回",
-            f"自動: +{self.player.get_auto_rate():.1f}/秒",
-        ]
-        y: int = 150
-        for stat in stats:
-            text_surface: pygame.Surface = self.fonts["small"].render(
-                stat, True, COLORS["text_light"]
+
+        area: pygame.Rect = bg_rect.union(digits_rect).union(label_rect)
+        ox, oy = area.topleft
+        hud: pygame.Surface = pygame.Surface(area.size, pygame.SRCALPHA)
+        # 画面は不透明なので背景は白で塗りつぶされて見える
+        hud.blit(self._points_bg, bg_rect.move(-ox, -oy))
+        glyphs: list[tuple[pygame.Surface, tuple[int, int]]] = []
+        for ch in points_text:
+            glyphs.append((self._digit_surfs[ch], (x - ox, y - oy)))
+            x += digit_w[ch]
+        hud.blits(glyphs, doreturn=False)
+        hud.blit(label_surface, label_rect.move(-ox, -oy))
+        return hud, (ox, oy)
+
+    def _draw_stats(self, blits: list[tuple[pygame.Surface, Any]]) -> None:
+        """ステータス表示 (表示値が変わった時だけ組み直す)"""
+        player: Player = self.player
+        key: tuple[int, float] = (player.get_click_power(), player.get_auto_rate())
+        if key != self._stats_key:
+            self._stats_key = key
+            stats: tuple[str, str] = (
+                f"クリック: +{key[0]}/回",
+                f"自動: +{key[1]:.1f}/秒",
             )
-            screen.blit(text_surface, (50, y))
-            y += 25
+            lines: list[pygame.Surface] = [
+                self.text_cache.render(self.fonts["small"], stat, COLORS["text_light"])
+                for stat in stats
+            ]
+            width: int = max(line.get_width() for line in lines)
+            height: int = 25 * (len(lines) - 1) + lines[-1].get_height()
+            self._stats_surface = pygame.Surface((width, height), pygame.SRCALPHA)
+            for i, line in enumerate(lines):
+                self._stats_surface.blit(line, (0, 25 * i))
+        blits.append((self._stats_surface, (50, 150)))
 
     def cleanup(self) -> None:
         """終了処理"""
+        self.save_manager.close()
         self._save_game()
         self.sound_manager.cleanup()
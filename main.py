@@ -8,7 +8,7 @@ import sys
 
 import pygame
 
-from settings import COLORS, FPS, SCREEN_HEIGHT, SCREEN_WIDTH, TITLE
+from settings import BACKGROUND_FPS, COLORS, FPS, SCREEN_HEIGHT, SCREEN_WIDTH, TITLE
 
 
 def main() -> None:
@@ -23,6 +23,18 @@ def main() -> None:
     # ウィンドウ設定
     screen: pygame.Surface = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
     pygame.display.set_caption(TITLE)
+    # 使うイベントだけをキューに積ませる
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed([
+        pygame.QUIT,
+        pygame.MOUSEBUTTONDOWN,
+        pygame.MOUSEBUTTONUP,
+        pygame.MOUSEMOTION,
+        pygame.MOUSEWHEEL,
+        pygame.WINDOWEXPOSED,
+        pygame.WINDOWFOCUSGAINED,
+        pygame.WINDOWFOCUSLOST,
+    ])
 
     # クロック設定
     clock: pygame.time.Clock = pygame.time.Clock()
@@ -33,22 +45,50 @@ def main() -> None:
 
     # メインゲームループ
     running: bool = True
+    focused: bool = True
     while running:
         # イベント処理
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+        events: list[pygame.event.Event] = pygame.event.get()
+        last: int = len(events) - 1
+        for i, event in enumerate(events):
+            etype: int = event.type
+            if etype == pygame.QUIT:
                 running = False
             else:
+                # 連続したマウス移動は最後の 1 件だけ渡す (途中の位置は描画に影響しない)
+                if (
+                    etype == pygame.MOUSEMOTION
+                    and i < last
+                    and events[i + 1].type == pygame.MOUSEMOTION
+                ):
+                    continue
+                if etype == pygame.WINDOWFOCUSLOST:
+                    focused = False
+                elif etype == pygame.WINDOWFOCUSGAINED:
+                    focused = True
                 game.handle_event(event)
 
-        # 更新
-        dt: float = clock.tick(FPS) / 1000.0  # 秒に変換
+        # 更新 (非アクティブ時はフレームレートを落とす)
+        dt: float = clock.tick(FPS if focused else BACKGROUND_FPS) / 1000.0  # 秒に変換
         game.update(dt)
 
-        # 描画
-        screen.fill(COLORS["background"])
-        game.draw(screen)
-        pygame.display.flip()
+        # 描画 (画面に変化があったフレームだけ)
+        if game.dirty:
+            rects: list[pygame.Rect] = game.dirty_rects
+            if rects:
+                # 変わった範囲をまとめた矩形にクリップして1回だけ描き直し、
+                # 転送は変わった範囲だけにする
+                screen.set_clip(rects[0].unionall(rects[1:]))
+                screen.fill(COLORS["background"])
+                game.draw(screen)
+                screen.set_clip(None)
+                pygame.display.update(rects)
+                rects.clear()
+            else:
+                screen.fill(COLORS["background"])
+                game.draw(screen)
+                pygame.display.flip()
+            game.dirty = False
 
     # 終了処理
     game.cleanup()
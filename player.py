@@ -4,68 +4,124 @@
 
 from __future__ import annotations
 
-import random
+import math
+from random import random as _rand
 from typing import Any
 
-from settings import UPGRADES
+from settings import (
+    UPGRADE_BASE_COSTS,
+    UPGRADE_INDEX,
+    UPGRADE_MAX_LEVELS,
+    UPGRADE_MULTS,
+    UPGRADE_ORDER,
+    UPGRADES,
+)
+
+# アップグレードのレベル別コスト表 (並び順ごと、必要になったレベルまで遅延して伸ばす)
+_COST_TABLES: tuple[list[int], ...] = tuple([] for _ in UPGRADE_ORDER)
+
+
+def _cost_at(index: int, level: int) -> int:
+    """指定レベルでのアップグレードコストを返す"""
+    table: list[int] = _COST_TABLES[index]
+    if level >= len(table):
+        base: float = UPGRADE_BASE_COSTS[index]
+        mult: float = UPGRADE_MULTS[index]
+        # 誤差が積み重ならないよう各レベルは直接べき乗で求める
+        table.extend(int(base * (mult ** lv)) for lv in range(len(table), level + 1))
+    return table[level]
 
 
 class Player:
     """プレイヤーデータを管理するクラス"""
 
+    __slots__ = (
+        "_auto_accum",
+        "_auto_elapsed",
+        "_auto_rate",
+        "_click_power",
+        "_lucky_chance",
+        "min_upgrade_level",
+        "points",
+        "total_clicks",
+        "total_points_earned",
+        "total_upgrade_levels",
+        "upgrade_levels",
+    )
+
     def __init__(self) -> None:
         """初期化"""
         self.points: float = 0.0
         self.total_points_earned: float = 0.0
         self.total_clicks: int = 0
         self.upgrade_levels: dict[str, int] = {key: 0 for key in UPGRADES.keys()}
+        # 実績判定用の集計値 (購入・ロード時に更新)
+        self.total_upgrade_levels: int = 0
+        self.min_upgrade_level: int = 0
+        # アップグレード効果の計算結果 (購入・ロード時に更新)
+        self._click_power: int = 1
+        self._auto_rate: float = 0.0
+        self._lucky_chance: float = 0.0
+        # 自動収益のうちまだ加算していない端数と、まだ精算していない経過秒数
+        self._auto_accum: float = 0.0
+        self._auto_elapsed: float = 0.0
+        self._refresh_upgrade_effects()
 
     def get_click_power(self) -> int:
-        """クリックパワーを計算"""
+        """クリックパワーを取得"""
+        return self._click_power
+
+    def get_auto_rate(self) -> float:
+        """毎秒の自動獲得ポイントを取得"""
+        return self._auto_rate
+
+    def get_lucky_chance(self) -> float:
+        """ラッキーボーナスの確率を取得 (0.0 ~ 1.0)"""
+        return self._lucky_chance
+
+    def _refresh_upgrade_effects(self) -> None:
+        """アップグレードレベルから各効果を再計算"""
+        # ここまでの経過時間は変更前の毎秒収益で精算する
+        self._settle_auto()
+        levels: dict[str, int] = self.upgrade_levels
         base_power: int = 1
         # 撫でる力
-        base_power += self.upgrade_levels["click_power"] * UPGRADES["click_power"]["effect_per_level"]
+        base_power += levels["click_power"] * UPGRADES["click_power"]["effect_per_level"]
         # 黄金の手
-        base_power += self.upgrade_levels["golden_touch"] * UPGRADES["golden_touch"]["effect_per_level"]
-        return base_power
+        base_power += levels["golden_touch"] * UPGRADES["golden_touch"]["effect_per_level"]
+        self._click_power = base_power
 
-    def get_auto_rate(self) -> float:
-        """毎秒の自動獲得ポイントを計算"""
         rate: float = 0.0
         # お手伝い妖精
-        rate += self.upgrade_levels["auto_click"] * UPGRADES["auto_click"]["effect_per_level"]
+        rate += levels["auto_click"] * UPGRADES["auto_click"]["effect_per_level"]
         # 妖精軍団
-        rate += self.upgrade_levels["fairy_army"] * UPGRADES["fairy_army"]["effect_per_level"]
-        return rate
+        rate += levels["fairy_army"] * UPGRADES["fairy_army"]["effect_per_level"]
+        self._auto_rate = rate
 
-    def get_lucky_chance(self) -> float:
-        """ラッキーボーナスの確率を取得 (0.0 ~ 1.0)"""
         base_chance: float = 0.0
-        level: int = self.upgrade_levels["lucky_bonus"]
+        level: int = levels["lucky_bonus"]
         if level > 0:
             base_chance = 0.10  # 基本10%
             base_chance += (level - 1) * (UPGRADES["lucky_bonus"]["effect_per_level"] / 100.0)
-        return min(base_chance, 0.5)  # 最大50%
+        self._lucky_chance = min(base_chance, 0.5)  # 最大50%
 
     def get_upgrade_cost(self, upgrade_id: str) -> int:
         """アップグレードのコストを計算"""
-        if upgrade_id not in UPGRADES:
+        index: int | None = UPGRADE_INDEX.get(upgrade_id)
+        if index is None:
             return 0
-        upgrade: dict[str, Any] = UPGRADES[upgrade_id]
-        level: int = self.upgrade_levels[upgrade_id]
-        cost: float = upgrade["base_cost"] * (upgrade["cost_multiplier"] ** level)
-        return int(cost)
+        return _cost_at(index, self.upgrade_levels[upgrade_id])
 
     def can_afford_upgrade(self, upgrade_id: str) -> bool:
         """アップグレードを購入できるか確認"""
-        if upgrade_id not in UPGRADES:
+        index: int | None = UPGRADE_INDEX.get(upgrade_id)
+        if index is None:
             return False
-        # 最大レベルチェック
-        upgrade: dict[str, Any] = UPGRADES[upgrade_id]
-        if "max_level" in upgrade:
-            if self.upgrade_levels[upgrade_id] >= upgrade["max_level"]:
-                return False
-        return self.points >= self.get_upgrade_cost(upgrade_id)
+        level: int = self.upgrade_levels[upgrade_id]
+        # 最大レベルチェック (上限なしは無限大)
+        if level >= UPGRADE_MAX_LEVELS[index]:
+            return False
+        return self.points >= _cost_at(index, level)
 
     def purchase_upgrade(self, upgrade_id: str) -> bool:
         """アップグレードを購入"""
@@ -73,7 +129,12 @@ class Player:
             return False
         cost: int = self.get_upgrade_cost(upgrade_id)
         self.points -= cost
-        self.upgrade_levels[upgrade_id] += 1
+        level: int = self.upgrade_levels[upgrade_id] + 1
+        self.upgrade_levels[upgrade_id] = level
+        self.total_upgrade_levels += 1
+        if level - 1 == self.min_upgrade_level:
+            self.min_upgrade_level = min(self.upgrade_levels.values())
+        self._refresh_upgrade_effects()
         return True
 
     def add_points(self, amount: float) -> None:
@@ -83,21 +144,38 @@ class Player:
 
     def click(self, multiplier: int = 1) -> tuple[int, bool]:
         """クリック処理 - (獲得ポイント, ラッキー発動) を返す"""
-        base_points: int = self.get_click_power()
-
-        # イベント倍率
-        base_points *= multiplier
-
-        # ラッキーボーナス判定
-        lucky: bool = False
-        if random.random() < self.get_lucky_chance():
-            base_points *= 2
-            lucky = True
+        # ラッキーボーナス判定 (発動時は 1 ビットずらして 2 倍)
+        lucky: bool = _rand() < self._lucky_chance
+        base_points: int = (self._click_power * multiplier) << lucky
 
         self.add_points(base_points)
         self.total_clicks += 1
         return base_points, lucky
 
+    def advance(self, dt: float) -> None:
+        """自動収益の経過時間を dt 秒進める (加算は tick でまとめて行う)"""
+        self._auto_elapsed += dt
+
+    def _settle_auto(self) -> None:
+        """未精算の経過時間を現在の毎秒収益で端数にためる"""
+        self._auto_accum += self._auto_rate * self._auto_elapsed
+        self._auto_elapsed = 0.0
+
+    def tick(self) -> int:
+        """たまった自動収益の整数分だけ加算 - 加算したポイントを返す"""
+        self._settle_auto()
+        whole: int = int(self._auto_accum)
+        if whole:
+            self._auto_accum -= whole
+            self.add_points(whole)
+        return whole
+
+    def seconds_to_next_auto_point(self) -> float:
+        """次に自動収益が 1 ポイントたまるまでの秒数"""
+        if self._auto_rate <= 0:
+            return math.inf
+        return (1.0 - self._auto_accum) / self._auto_rate - self._auto_elapsed
+
     def to_dict(self) -> dict[str, Any]:
         """セーブ用に辞書に変換"""
         return {
@@ -116,3 +194,11 @@ class Player:
         for key in self.upgrade_levels:
             if key in saved_levels:
                 self.upgrade_levels[key] = saved_levels[key]
+        self._refresh_upgrade_totals()
+        self._refresh_upgrade_effects()
+
+    def _refresh_upgrade_totals(self) -> None:
+        """アップグレードの合計・最小レベルを再計算"""
+        levels = self.upgrade_levels.values()
+        self.total_upgrade_levels = sum(levels)
+        self.min_upgrade_level = min(levels) if self.upgrade_levels else 0
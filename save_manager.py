@@ -6,6 +6,9 @@ from __future__ import annotations
 
 import json
 import os
+import queue
+import threading
+import time
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
@@ -21,6 +24,10 @@ class SaveManager:
     def __init__(self, save_path: str = SAVE_FILE) -> None:
         """初期化"""
         self.save_path: str = save_path
+        # バックグラウンド保存 (最新のスナップショット 1 件だけ待たせる)
+        self._write_lock: threading.Lock = threading.Lock()
+        self._queue: queue.Queue[dict[str, Any] | None] = queue.Queue(maxsize=1)
+        self._worker: threading.Thread | None = None
 
     def save(
         self,
@@ -30,19 +37,88 @@ class SaveManager:
     ) -> bool:
         """ゲームデータをセーブ"""
         try:
-            data: dict[str, Any] = {
-                "player": player.to_dict(),
-                "last_played": datetime.now().isoformat(),
-                "daily_login": datetime.now().strftime("%Y-%m-%d"),
-                "settings": settings or {
-                    "bgm_volume": DEFAULT_BGM_VOLUME,
-                    "sfx_volume": DEFAULT_SFX_VOLUME,
-                },
-            }
-            if extra:
-                data.update(extra)
-            with open(self.save_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            data: dict[str, Any] = self._build_data(player, settings, extra)
+        except Exception as e:
+            print(f"セーブエラー: {e}")
+            return False
+        return self._write(data)
+
+    def save_async(
+        self,
+        player: Player,
+        settings: dict[str, Any] | None = None,
+        extra: dict[str, Any] | None = None,
+    ) -> None:
+        """スナップショットだけ作り、書き込みはバックグラウンドで行う"""
+        try:
+            data: dict[str, Any] = self._build_data(player, settings, extra)
+        except Exception as e:
+            print(f"セーブエラー: {e}")
+            return
+        if self._worker is None:
+            self._worker = threading.Thread(target=self._run_worker, daemon=True)
+            self._worker.start()
+        # 未処理の古いスナップショットがあれば新しいもので置き換える
+        try:
+            self._queue.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            self._queue.put_nowait(data)
+        except queue.Full:
+            pass
+
+    def close(self, timeout: float = 2.0) -> None:
+        """バックグラウンド保存を終了"""
+        if self._worker is None:
+            return
+        try:
+            self._queue.get_nowait()
+        except queue.Empty:
+            pass
+        self._queue.put(None)
+        self._worker.join(timeout)
+        self._worker = None
+
+    def _run_worker(self) -> None:
+        while True:
+            data = self._queue.get()
+            if data is None:
+                return
+            self._write(data)
+
+    def _build_data(
+        self,
+        player: Player,
+        settings: dict[str, Any] | None,
+        extra: dict[str, Any] | None,
+    ) -> dict[str, Any]:
+        now: datetime = datetime.now()
+        data: dict[str, Any] = {
+            "player": player.to_dict(),
+            "last_played": now.isoformat(),
+            # オフライン時間の計算用 (文字列の日時解析を省く)
+            "last_played_ts": now.timestamp(),
+            "daily_login": now.date().isoformat(),
+            "settings": settings or {
+                "bgm_volume": DEFAULT_BGM_VOLUME,
+                "sfx_volume": DEFAULT_SFX_VOLUME,
+            },
+        }
+        if extra:
+            data.update(extra)
+        return data
+
+    def _write(self, data: dict[str, Any]) -> bool:
+        try:
+            # 整形なし・区切りの空白なしで文字列化してから一度に書き込む
+            text: str = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+            # 一時ファイルに書いてから置き換え、途中で落ちても元のセーブを壊さない
+            tmp_path: str = self.save_path + ".tmp"
+            with self._write_lock:
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    f.write(text)
+                os.replace(tmp_path, self.save_path)
             return True
         except Exception as e:
             print(f"セーブエラー: {e}")
@@ -60,12 +136,21 @@ class SaveManager:
             print(f"ロードエラー: {e}")
             return None
 
-    def calculate_offline_earnings(self, player: Player, last_played_str: str) -> float:
+    def calculate_offline_earnings(
+        self,
+        player: Player,
+        last_played_str: str,
+        last_played_ts: float | None = None,
+    ) -> float:
         """オフライン収益を計算"""
         try:
-            last_played: datetime = datetime.fromisoformat(last_played_str)
-            now: datetime = datetime.now()
-            offline_seconds: float = (now - last_played).total_seconds()
+            offline_seconds: float
+            if last_played_ts is not None:
+                offline_seconds = time.time() - last_played_ts
+            else:
+                # タイムスタンプのない古いセーブは日時文字列から求める
+                last_played: datetime = datetime.fromisoformat(last_played_str)
+                offline_seconds = (datetime.now() - last_played).total_seconds()
 
             # 最大24時間分まで
             max_offline_seconds: int = 24 * 60 * 60
@@ -84,8 +169,9 @@ class SaveManager:
     def delete_save(self) -> bool:
         """セーブデータを削除"""
         try:
-            if os.path.exists(self.save_path):
-                os.remove(self.save_path)
+            os.remove(self.save_path)
+            return True
+        except FileNotFoundError:
             return True
         except Exception as e:
             print(f"セーブ削除エラー: {e}")
@@ -93,4 +179,4 @@ class SaveManager:
 
     def has_save(self) -> bool:
         """セーブデータが存在するか確認"""
-        return os.path.exists(self.save_path)
+        return os.path.isfile(self.save_path)
@@ -6,6 +6,7 @@
 SCREEN_WIDTH = 1280
 SCREEN_HEIGHT = 720
 FPS = 60
+BACKGROUND_FPS = 5  # ウィンドウが非アクティブな時のフレームレート
 TITLE = "Healing Clicker"
 
 # 色定義 (RGB)
@@ -72,6 +73,13 @@ UPGRADES = {
     },
 }
 
+# アップグレード定義を並び順ごとのタプルに展開したもの (ホットパスでの入れ子辞書参照を避ける)
+UPGRADE_ORDER = tuple(UPGRADES)
+UPGRADE_INDEX = {upgrade_id: i for i, upgrade_id in enumerate(UPGRADE_ORDER)}
+UPGRADE_BASE_COSTS = tuple(UPGRADES[k]["base_cost"] for k in UPGRADE_ORDER)
+UPGRADE_MULTS = tuple(UPGRADES[k]["cost_multiplier"] for k in UPGRADE_ORDER)
+UPGRADE_MAX_LEVELS = tuple(UPGRADES[k].get("max_level", float("inf")) for k in UPGRADE_ORDER)
+
 # アニメーション設定
 ANIMATION = {
     "click_scale_duration": 0.18,  # 秒
@@ -80,6 +88,7 @@ ANIMATION = {
     "click_scale_max_x": 1.08,     # ぷにっと広がる横方向スケール
     "popup_duration": 1.0,        # 秒
     "popup_rise_distance": 40,    # ピクセル
+    "max_particles": 600,         # 同時に存在できるパーティクル数
 }
 
 # キャラクター設定
@@ -103,6 +112,7 @@ UI_LAYOUT = {
 # セーブ設定
 SAVE_FILE = "save_data.json"
 AUTO_SAVE_INTERVAL = 30  # 秒
+AUTO_EARN_TICK = 0.25  # 自動収益を加算する最短間隔 (秒)
 
 # サウンド設定
 DEFAULT_BGM_VOLUME = 0.5
@@ -5,11 +5,22 @@
 from __future__ import annotations
 
 import os
+import threading
 
 import pygame
 
 from settings import DEFAULT_BGM_VOLUME, DEFAULT_SFX_VOLUME
 
+# 専用チャンネルを確保する頻出の効果音 (チャンネル番号順)
+_RESERVED_SOUNDS: tuple[str, ...] = ("click", "upgrade")
+
+# 効果音名 → ファイル名
+_SOUND_FILES: dict[str, str] = {
+    "click": "click.wav",
+    "upgrade": "upgrade.wav",
+    "bonus": "bonus.wav",
+}
+
 
 class SoundManager:
     """サウンド管理クラス"""
@@ -21,47 +32,90 @@ class SoundManager:
         self.sounds: dict[str, pygame.mixer.Sound] = {}
         self.current_bgm: str | None = None
         self.is_initialized: bool = False
+        # バックグラウンド読み込みスレッド
+        self._loader: threading.Thread | None = None
+
+        # 頻出の効果音専用のチャンネル (空きチャンネルを探さずに鳴らす)
+        self._channels: dict[str, pygame.mixer.Channel] = {}
 
         # pygame.mixerが初期化されているか確認
         if pygame.mixer.get_init():
             self.is_initialized = True
+            self._reserve_channels()
+
+    def _reserve_channels(self) -> None:
+        """頻出の効果音に専用チャンネルを割り当てる"""
+        try:
+            reserved: int = pygame.mixer.set_reserved(len(_RESERVED_SOUNDS))
+            for i, name in enumerate(_RESERVED_SOUNDS[:reserved]):
+                self._channels[name] = pygame.mixer.Channel(i)
+        except pygame.error as e:
+            print(f"チャンネル確保エラー: {e}")
 
     def load_sound(self, name: str, path: str) -> bool:
         """効果音をロード"""
         if not self.is_initialized:
             return False
+        sound: pygame.mixer.Sound | None = self._decode_sound(name, path)
+        if sound is None:
+            return False
+        self.sounds[name] = sound
+        return True
+
+    def _decode_sound(self, name: str, path: str) -> pygame.mixer.Sound | None:
+        """効果音ファイルを読み込んで返す (失敗時は None)"""
         try:
             if os.path.exists(path):
-                self.sounds[name] = pygame.mixer.Sound(path)
-                self.sounds[name].set_volume(self.sfx_volume)
-                return True
-            else:
-                print(f"サウンドファイルが見つかりません: {path}")
-                return False
+                return pygame.mixer.Sound(path)
+            print(f"サウンドファイルが見つかりません: {path}")
+            return None
         except Exception as e:
             print(f"サウンドロードエラー ({name}): {e}")
-            return False
+            return None
 
     def load_all_sounds(self, sound_dir: str = "assets/sounds") -> None:
         """全効果音をロード"""
-        sound_files: dict[str, str] = {
-            "click": "click.wav",
-            "upgrade": "upgrade.wav",
-            "bonus": "bonus.wav",
-        }
-        for name, filename in sound_files.items():
+        for name, filename in _SOUND_FILES.items():
             path: str = os.path.join(sound_dir, filename)
             self.load_sound(name, path)
 
+    def load_all_sounds_async(
+        self, sound_dir: str = "assets/sounds", bgm_path: str | None = None
+    ) -> None:
+        """全効果音 (と BGM) をバックグラウンドで読み込む"""
+        if not self.is_initialized:
+            return
+        self._loader = threading.Thread(
+            target=self._load_worker, args=(sound_dir, bgm_path), daemon=True
+        )
+        self._loader.start()
+
+    def _load_worker(self, sound_dir: str, bgm_path: str | None) -> None:
+        loaded: dict[str, pygame.mixer.Sound] = {}
+        for name, filename in _SOUND_FILES.items():
+            sound = self._decode_sound(name, os.path.join(sound_dir, filename))
+            if sound is not None:
+                loaded[name] = sound
+        # 辞書ごと差し替え、再生側には読み込み済みの辞書だけを見せる
+        self.sounds = {**self.sounds, **loaded}
+        if bgm_path and self.load_bgm(bgm_path):
+            self.play_bgm()
+
     def play_sound(self, name: str) -> None:
         """効果音を再生"""
-        if not self.is_initialized:
+        # 未初期化・読み込み完了前の効果音は辞書に無いので無視される
+        # (読み込めた Sound の再生は失敗しないので例外処理は読み込み側だけで行う)
+        sound: pygame.mixer.Sound | None = self.sounds.get(name)
+        if sound is None:
             return
-        if name in self.sounds:
-            try:
-                self.sounds[name].play()
-            except Exception as e:
-                print(f"サウンド再生エラー ({name}): {e}")
+        # 音量は再生したチャンネルに設定する (Sound 側は 1.0 のまま)
+        channel: pygame.mixer.Channel | None = self._channels.get(name)
+        if channel is not None:
+            channel.play(sound)
+        else:
+            channel = sound.play()
+        if channel is not None:
+            channel.set_volume(self.sfx_volume)
 
     def load_bgm(self, path: str) -> bool:
         """BGMをロード"""
@@ -126,13 +180,8 @@ class SoundManager:
                 pass
 
     def set_sfx_volume(self, volume: float) -> None:
-        """効果音音量を設定"""
+        """効果音音量を設定 (次に再生する効果音から反映)"""
         self.sfx_volume = max(0.0, min(1.0, volume))
-        for sound in self.sounds.values():
-            try:
-                sound.set_volume(self.sfx_volume)
-            except Exception:
-                pass
 
     def get_bgm_volume(self) -> float:
         """BGM音量を取得"""
@@ -144,5 +193,8 @@ class SoundManager:
 
     def cleanup(self) -> None:
         """リソース解放"""
+        if self._loader is not None:
+            self._loader.join(timeout=2.0)
+            self._loader = None
         self.stop_bgm()
         self.sounds.clear()
@@ -4,20 +4,118 @@ UI部品（ボタン、スライダー、アップグレードパネル等）
 
 from __future__ import annotations
 
+from collections import OrderedDict
+from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 
 import pygame
 
+from character_manager import to_display_format
 from settings import ACHIEVEMENTS, AFFECTION, CHARACTERS, COLORS, UPGRADES
 
 if TYPE_CHECKING:
     from character_manager import CharacterManager
     from player import Player
 
+    ProgressFunc = Callable[[Player, CharacterManager], float]
+
+# 半透明の描画色 (RGBA)
+_PANEL_BG_RGBA: tuple[int, int, int, int] = (*COLORS["white"], 200)
+_ROW_TODO_RGBA: tuple[int, int, int, int] = (*COLORS["text_light"], 80)
+_OVERLAY_RGBA: tuple[int, int, int, int] = (0, 0, 0, 128)
+
+
+# ==================================================================
+# テキスト描画キャッシュ
+# ==================================================================
+class TextCache:
+    """(フォント, 文字列, 色) ごとに描画済みテキストを保持する LRU キャッシュ"""
+
+    def __init__(self, max_size: int = 256) -> None:
+        self.max_size: int = max_size
+        self._cache: OrderedDict[
+            tuple[pygame.font.Font, str, tuple[int, ...]], pygame.Surface
+        ] = OrderedDict()
+
+    def render(
+        self, font: pygame.font.Font, text: str, color: tuple[int, ...]
+    ) -> pygame.Surface:
+        """キャッシュ済みならそれを、無ければ描画して返す"""
+        key = (font, text, color)
+        surface = self._cache.get(key)
+        if surface is not None:
+            self._cache.move_to_end(key)
+            return surface
+        surface = to_display_format(font.render(text, True, color))
+        self._cache[key] = surface
+        if len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+        return surface
+
+    def clear(self) -> None:
+        """キャッシュを破棄 (フォントを差し替えた時用)"""
+        self._cache.clear()
+
+
+# UI部品で共有する、値によって変わる文字列用のキャッシュ
+_TEXT_CACHE: TextCache = TextCache(512)
+
+
+# ボタン背景 ((幅, 高さ, 背景色, 角丸半径) ごとに枠線込みで一度だけ描いて共有)
+_BUTTON_BGS: dict[tuple[int, int, tuple[int, int, int], int], pygame.Surface] = {}
+
+
+def _get_button_bg(
+    size: tuple[int, int], color: tuple[int, int, int], border_radius: int
+) -> pygame.Surface:
+    """枠線付きの角丸ボタン背景を返す"""
+    key = (size[0], size[1], color, border_radius)
+    bg: pygame.Surface | None = _BUTTON_BGS.get(key)
+    if bg is None:
+        bg = pygame.Surface(size, pygame.SRCALPHA)
+        rect = bg.get_rect()
+        pygame.draw.rect(bg, color, rect, border_radius=border_radius)
+        pygame.draw.rect(bg, COLORS["text"], rect, 2, border_radius=border_radius)
+        bg = to_display_format(bg)
+        _BUTTON_BGS[key] = bg
+    return bg
+
+
+# モーダル用の半透明オーバーレイ (画面サイズごとに一度だけ作って共有)
+_OVERLAYS: dict[tuple[int, int], pygame.Surface] = {}
+
+
+def _get_overlay(size: tuple[int, int]) -> pygame.Surface:
+    """画面全体を覆う半透明の黒いサーフェスを返す"""
+    overlay: pygame.Surface | None = _OVERLAYS.get(size)
+    if overlay is None:
+        overlay = to_display_format(pygame.Surface(size, pygame.SRCALPHA))
+        overlay.fill(_OVERLAY_RGBA)
+        _OVERLAYS[size] = overlay
+    return overlay
+
 
 class Button:
     """汎用ボタンクラス"""
 
+    __slots__ = (
+        "_text_rect",
+        "_text_surface",
+        "_x0",
+        "_x1",
+        "_y0",
+        "_y1",
+        "border_radius",
+        "color",
+        "font",
+        "hover_color",
+        "is_enabled",
+        "is_hovered",
+        "rect",
+        "text",
+        "text_color",
+    )
+
     def __init__(
         self,
         x: int,
@@ -41,17 +139,27 @@ class Button:
         self.border_radius: int = border_radius
         self.is_hovered: bool = False
         self.is_enabled: bool = True
+        # 描画済みラベルと配置 (文字列が変わった時だけ描き直す)
+        self._text_surface: pygame.Surface = to_display_format(
+            font.render(text, True, self.text_color)
+        )
+        self._text_rect: pygame.Rect = self._text_surface.get_rect(center=self.rect.center)
+        # 当たり判定用の境界 (ボタンは動かない、collidepoint と同じく右端・下端は含まない)
+        self._x0, self._y0 = self.rect.topleft
+        self._x1, self._y1 = self.rect.bottomright
 
     def handle_event(self, event: pygame.event.Event) -> bool:
         """イベント処理 - クリックされたらTrueを返す"""
         if not self.is_enabled:
             return False
 
-        if event.type == pygame.MOUSEMOTION:
-            self.is_hovered = self.rect.collidepoint(event.pos)
-        elif event.type == pygame.MOUSEBUTTONDOWN:
-            if event.button == 1 and self.rect.collidepoint(event.pos):
-                return True
+        etype: int = event.type
+        if etype == pygame.MOUSEMOTION:
+            x, y = event.pos
+            self.is_hovered = self._x0 <= x < self._x1 and self._y0 <= y < self._y1
+        elif etype == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            x, y = event.pos
+            return self._x0 <= x < self._x1 and self._y0 <= y < self._y1
         return False
 
     def draw(self, surface: pygame.Surface) -> None:
@@ -65,16 +173,19 @@ class Button:
         else:
             bg_color = self.color
 
-        # 背景描画
-        pygame.draw.rect(surface, bg_color, self.rect, border_radius=self.border_radius)
-
-        # 枠線
-        pygame.draw.rect(surface, COLORS["text"], self.rect, 2, border_radius=self.border_radius)
+        # 背景・枠線
+        surface.blit(_get_button_bg(self.rect.size, bg_color, self.border_radius), self.rect)
 
         # テキスト描画
-        text_surface: pygame.Surface = self.font.render(self.text, True, self.text_color)
-        text_rect: pygame.Rect = text_surface.get_rect(center=self.rect.center)
-        surface.blit(text_surface, text_rect)
+        surface.blit(self._text_surface, self._text_rect)
+
+    def set_text(self, text: str) -> None:
+        """表示文字列を変更"""
+        if text == self.text:
+            return
+        self.text = text
+        self._text_surface = to_display_format(self.font.render(text, True, self.text_color))
+        self._text_rect = self._text_surface.get_rect(center=self.rect.center)
 
     def set_enabled(self, enabled: bool) -> None:
         """有効/無効を設定"""
@@ -84,6 +195,27 @@ class Button:
 class Slider:
     """スライダーUIクラス"""
 
+    __slots__ = (
+        "_bar_key",
+        "_bar_surface",
+        "_inv_range",
+        "_inv_width",
+        "_knob_surface",
+        "_knob_y",
+        "_label_pos",
+        "_span",
+        "_track_w",
+        "_track_x",
+        "_value_pos",
+        "is_dragging",
+        "knob_radius",
+        "label",
+        "max_val",
+        "min_val",
+        "rect",
+        "value",
+    )
+
     def __init__(
         self,
         x: int,
@@ -103,6 +235,28 @@ class Slider:
         self.label: str = label
         self.is_dragging: bool = False
         self.knob_radius: int = height
+        # 毎回の割り算を避けるための逆数
+        self._inv_range: float = 1.0 / (max_val - min_val)
+        self._inv_width: float = 1.0 / width
+        # マウス移動ごとに使う値 (範囲・トラック位置は固定)
+        self._span: float = max_val - min_val
+        self._track_x: int = x
+        self._track_w: int = width
+        # トラック+塗り (塗り幅が変わった時だけ描き直す) と、つまみの描画済みサーフェス
+        self._bar_key: int | None = None
+        self._bar_surface: pygame.Surface = to_display_format(
+            pygame.Surface((width, height), pygame.SRCALPHA)
+        )
+        r: int = self.knob_radius
+        self._knob_surface: pygame.Surface = to_display_format(
+            pygame.Surface((r * 2 + 2, r * 2 + 2), pygame.SRCALPHA)
+        )
+        pygame.draw.circle(self._knob_surface, COLORS["white"], (r + 1, r + 1), r)
+        pygame.draw.circle(self._knob_surface, COLORS["text"], (r + 1, r + 1), r, 2)
+        # 描画位置 (スライダーは動かない)
+        self._knob_y: int = self.rect.centery - (r + 1)
+        self._label_pos: tuple[int, int] = (x, y - 25)
+        self._value_pos: tuple[int, int] = (self.rect.right + 10, y - 5)
 
     def handle_event(self, event: pygame.event.Event) -> bool:
         """イベント処理 - 値が変更されたらTrueを返す"""
@@ -130,50 +284,45 @@ class Slider:
 
     def _get_knob_x(self) -> int:
         """つまみのX座標を取得"""
-        ratio: float = (self.value - self.min_val) / (self.max_val - self.min_val)
-        return int(self.rect.x + ratio * self.rect.width)
+        ratio: float = (self.value - self.min_val) * self._inv_range
+        return int(self._track_x + ratio * self._track_w)
 
     def _update_value(self, mouse_x: int) -> None:
         """マウスX座標から値を更新"""
-        ratio: float = (mouse_x - self.rect.x) / self.rect.width
-        ratio = max(0.0, min(1.0, ratio))
-        self.value = self.min_val + ratio * (self.max_val - self.min_val)
+        ratio: float = (mouse_x - self._track_x) * self._inv_width
+        if ratio < 0.0:
+            ratio = 0.0
+        elif ratio > 1.0:
+            ratio = 1.0
+        self.value = self.min_val + ratio * self._span
 
     def draw(self, surface: pygame.Surface, font: pygame.font.Font) -> None:
         """描画"""
         # ラベル描画
         if self.label:
-            label_surface: pygame.Surface = font.render(self.label, True, COLORS["text"])
-            surface.blit(label_surface, (self.rect.x, self.rect.y - 25))
-
-        # トラック描画
-        pygame.draw.rect(surface, COLORS["text_light"], self.rect, border_radius=5)
-
-        # 塗りつぶし部分
-        filled_width: int = int(self.rect.width * (self.value - self.min_val) / (self.max_val - self.min_val))
-        filled_rect: pygame.Rect = pygame.Rect(self.rect.x, self.rect.y, filled_width, self.rect.height)
-        pygame.draw.rect(surface, COLORS["primary"], filled_rect, border_radius=5)
+            label_surface: pygame.Surface = _TEXT_CACHE.render(font, self.label, COLORS["text"])
+            surface.blit(label_surface, self._label_pos)
+
+        # トラック + 塗りつぶし部分
+        filled_width: int = int(self.rect.width * (self.value - self.min_val) * self._inv_range)
+        if filled_width != self._bar_key:
+            self._bar_key = filled_width
+            bar: pygame.Surface = self._bar_surface
+            bar.fill((0, 0, 0, 0))
+            pygame.draw.rect(bar, COLORS["text_light"], bar.get_rect(), border_radius=5)
+            pygame.draw.rect(
+                bar, COLORS["primary"], (0, 0, filled_width, self.rect.height), border_radius=5
+            )
+        surface.blit(self._bar_surface, self.rect)
 
         # つまみ描画
         knob_x: int = self._get_knob_x()
-        pygame.draw.circle(
-            surface,
-            COLORS["white"],
-            (knob_x, self.rect.centery),
-            self.knob_radius
-        )
-        pygame.draw.circle(
-            surface,
-            COLORS["text"],
-            (knob_x, self.rect.centery),
-            self.knob_radius,
-            2
-        )
+        surface.blit(self._knob_surface, (knob_x - self.knob_radius - 1, self._knob_y))
 
         # 値表示
         value_text: str = f"{int(self.value * 100)}%"
-        value_surface: pygame.Surface = font.render(value_text, True, COLORS["text"])
-        surface.blit(value_surface, (self.rect.right + 10, self.rect.y - 5))
+        value_surface: pygame.Surface = _TEXT_CACHE.render(font, value_text, COLORS["text"])
+        surface.blit(value_surface, self._value_pos)
 
     def get_value(self) -> float:
         """現在の値を取得"""
@@ -201,6 +350,24 @@ class UpgradePanel:
         self.buttons: dict[str, UpgradeButton] = {}
         self.scroll_offset: int = 0
         self._create_buttons()
+        # 背景とタイトルは変わらないので一度だけ描画しておく
+        self._background: pygame.Surface = pygame.Surface(
+            (self.rect.width, self.rect.height), pygame.SRCALPHA
+        )
+        pygame.draw.rect(
+            self._background,
+            _PANEL_BG_RGBA,
+            (0, 0, self.rect.width, self.rect.height),
+            border_radius=15
+        )
+        self._title: pygame.Surface = fonts["medium"].render(
+            "アップグレード", True, COLORS["text"]
+        )
+        # 描画済みのパネル全体 (ボタンごとの購入可否・ホバー・レベルが変わった時だけ描き直す)
+        self._panel_key: tuple[tuple[bool, bool, int], ...] | None = None
+        self._panel_surface: pygame.Surface = to_display_format(
+            pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
+        )
 
     def _create_buttons(self) -> None:
         """アップグレードボタンを作成"""
@@ -220,44 +387,106 @@ class UpgradePanel:
             )
             self.buttons[upgrade_id] = button
             y_offset += button_height + padding
+        # 毎フレーム回す用のボタン一覧 (ボタン構成は固定、ID は各ボタンが持つ)
+        self._buttons: tuple[UpgradeButton, ...] = tuple(self.buttons.values())
+        # 当たり判定用 (ボタンは等間隔の縦一列なので行番号を計算で求める)
+        self._hit_x1: int = self.rect.x + padding
+        self._hit_x2: int = self.rect.right - padding
+        self._hit_top: int = self.rect.y + padding
+        self._hit_step: int = button_height + padding
+        self._hit_h: int = button_height
+
+    def _index_at(self, pos: tuple[int, int]) -> int:
+        """指定位置にあるボタンの番号を返す (なければ -1)"""
+        x, y = pos
+        if not self._hit_x1 <= x < self._hit_x2 or y < self._hit_top:
+            return -1
+        index, offset = divmod(y - self._hit_top, self._hit_step)
+        if offset >= self._hit_h or index >= len(self._buttons):
+            return -1
+        return index
+
+    def button_at(self, pos: tuple[int, int]) -> UpgradeButton | None:
+        """指定位置にあるボタンを返す"""
+        index: int = self._index_at(pos)
+        return self._buttons[index] if index >= 0 else None
 
     def handle_event(self, event: pygame.event.Event, player: Player) -> str | None:
         """イベント処理 - 購入されたアップグレードIDを返す"""
-        for upgrade_id, button in self.buttons.items():
-            button.update_state(player)
-            if button.handle_event(event):
-                if player.can_afford_upgrade(upgrade_id):
-                    return upgrade_id
+        etype: int = event.type
+        if etype != pygame.MOUSEMOTION and etype != pygame.MOUSEBUTTONDOWN:
+            return None
+        # パネル外ならどのボタンにも当たらない (ホバーだけ解除)
+        if not self.rect.collidepoint(event.pos):
+            if etype == pygame.MOUSEMOTION:
+                for button in self._buttons:
+                    button.is_hovered = False
+            return None
+        index: int = self._index_at(event.pos)
+        if etype == pygame.MOUSEMOTION:
+            for i, button in enumerate(self._buttons):
+                button.is_hovered = i == index
+            return None
+        if event.button != 1 or index < 0:
+            return None
+        # 購入可否の表示状態は draw で更新する
+        upgrade_id: str = self._buttons[index].upgrade_id
+        if player.can_afford_upgrade(upgrade_id):
+            return upgrade_id
         return None
 
     def draw(self, surface: pygame.Surface, player: Player) -> None:
         """描画"""
-        # パネル背景
-        panel_surface: pygame.Surface = pygame.Surface(
-            (self.rect.width, self.rect.height), pygame.SRCALPHA
-        )
-        pygame.draw.rect(
-            panel_surface,
-            (*COLORS["white"], 200),
-            (0, 0, self.rect.width, self.rect.height),
-            border_radius=15
-        )
-        surface.blit(panel_surface, self.rect.topleft)
-
-        # タイトル
-        title_font: pygame.font.Font = self.fonts["medium"]
-        title_text: pygame.Surface = title_font.render("アップグレード", True, COLORS["text"])
-        surface.blit(title_text, (self.rect.x + 20, self.rect.y + 10))
-
-        # ボタン描画
-        for upgrade_id, button in self.buttons.items():
+        levels: dict[str, int] = player.upgrade_levels
+        for button in self._buttons:
             button.update_state(player)
-            button.draw(surface, player)
+        key: tuple[tuple[bool, bool, int], ...] = tuple(
+            (button.can_afford, button.is_hovered, levels[button.upgrade_id])
+            for button in self._buttons
+        )
+        if key != self._panel_key:
+            self._panel_key = key
+            self._redraw_panel(player)
+        surface.blit(self._panel_surface, self.rect.topleft)
+
+    def _redraw_panel(self, player: Player) -> None:
+        """パネル背景・タイトル・ボタンをキャッシュに描き直す"""
+        panel: pygame.Surface = self._panel_surface
+        panel.fill((0, 0, 0, 0))
+        # パネル背景・タイトル・ボタンを 1 回の blits でまとめて描く
+        blits: list[tuple[pygame.Surface, tuple[int, int]]] = [
+            (self._background, (0, 0)),
+            (self._title, (20, 10)),
+        ]
+        offset: tuple[int, int] = self.rect.topleft
+        for button in self._buttons:
+            blits.extend(button.get_blits(player, offset))
+        panel.blits(blits, doreturn=False)
 
 
 class UpgradeButton:
     """アップグレードボタン"""
 
+    __slots__ = (
+        "_afford_at",
+        "_cost",
+        "_cost_key",
+        "_cost_surface",
+        "_level",
+        "_level_key",
+        "_level_surface",
+        "_max_level",
+        "_pos_offset",
+        "_positions",
+        "_rows",
+        "can_afford",
+        "fonts",
+        "is_hovered",
+        "rect",
+        "upgrade",
+        "upgrade_id",
+    )
+
     def __init__(
         self,
         x: int,
@@ -275,10 +504,45 @@ class UpgradeButton:
         self.fonts: dict[str, pygame.font.Font] = fonts
         self.is_hovered: bool = False
         self.can_afford: bool = False
+        # レベルごとのコストと購入に必要なポイント (レベルが変わった時だけ求め直す)
+        self._max_level: float = upgrade.get("max_level", float("inf"))
+        self._level: int = -1
+        self._cost: int = 0
+        self._afford_at: float = float("inf")
+        # 背景・名前・説明を描画済みの行 (背景色ごと、名前と説明は変わらない)
+        name_surface: pygame.Surface = fonts["small"].render(
+            upgrade["name"], True, COLORS["text"]
+        )
+        desc_surface: pygame.Surface = fonts["small"].render(
+            upgrade["description"], True, COLORS["text_light"]
+        )
+        self._rows: dict[tuple[int, int, int], pygame.Surface] = {}
+        for bg_color in (COLORS["primary"], COLORS["success"], COLORS["text_light"]):
+            row: pygame.Surface = pygame.Surface((width, height), pygame.SRCALPHA)
+            pygame.draw.rect(row, bg_color, row.get_rect(), border_radius=10)
+            row.blit(name_surface, (10, 8))
+            row.blit(desc_surface, (10, 32))
+            self._rows[bg_color] = to_display_format(row)
+        # 行・レベル・コストの貼り付け位置 (描画先の左上座標が変わった時だけ求め直す)
+        self._pos_offset: tuple[int, int] = (0, 0)
+        self._positions: tuple[tuple[int, int], tuple[int, int], tuple[int, int]] = (
+            (x, y), (x + width - 70, y + 8), (x + 10, y + 55)
+        )
+        # レベル・コスト表示 (値が変わった時だけ描き直す)
+        self._level_key: int | None = None
+        self._level_surface: pygame.Surface | None = None
+        self._cost_key: tuple[int, bool] | None = None
+        self._cost_surface: pygame.Surface | None = None
 
     def update_state(self, player: Player) -> None:
         """状態を更新"""
-        self.can_afford = player.can_afford_upgrade(self.upgrade_id)
+        level: int = player.upgrade_levels[self.upgrade_id]
+        if level != self._level:
+            self._level = level
+            self._cost = player.get_upgrade_cost(self.upgrade_id)
+            # 最大レベルなら購入不可
+            self._afford_at = self._cost if level < self._max_level else float("inf")
+        self.can_afford = player.points >= self._afford_at
 
     def handle_event(self, event: pygame.event.Event) -> bool:
         """イベント処理"""
@@ -289,8 +553,21 @@ class UpgradeButton:
                 return True
         return False
 
-    def draw(self, surface: pygame.Surface, player: Player) -> None:
-        """描画"""
+    def draw(
+        self, surface: pygame.Surface, player: Player, offset: tuple[int, int] = (0, 0)
+    ) -> None:
+        """描画 (offset: 描画先サーフェスの画面上の左上座標)"""
+        surface.blits(self.get_blits(player, offset), doreturn=False)
+
+    def get_blits(
+        self, player: Player, offset: tuple[int, int] = (0, 0)
+    ) -> list[tuple[pygame.Surface, tuple[int, int]]]:
+        """描画するサーフェスと貼り付け位置の一覧を返す"""
+        if offset != self._pos_offset:
+            self._pos_offset = offset
+            x: int = self.rect.x - offset[0]
+            y: int = self.rect.y - offset[1]
+            self._positions = ((x, y), (x + self.rect.width - 70, y + 8), (x + 10, y + 55))
         # 背景色
         bg_color: tuple[int, int, int]
         if self.can_afford:
@@ -301,32 +578,34 @@ class UpgradeButton:
         else:
             bg_color = COLORS["text_light"]
 
-        # 背景描画
-        pygame.draw.rect(surface, bg_color, self.rect, border_radius=10)
-
-        # 名前
         name_font: pygame.font.Font = self.fonts["small"]
-        name_text: pygame.Surface = name_font.render(self.upgrade["name"], True, COLORS["text"])
-        surface.blit(name_text, (self.rect.x + 10, self.rect.y + 8))
 
         # レベル
         level: int = player.upgrade_levels[self.upgrade_id]
-        max_level: int | str = self.upgrade.get("max_level", "---")
-        level_text: pygame.Surface = name_font.render(f"Lv.{level}/{max_level}", True, COLORS["text"])
-        surface.blit(level_text, (self.rect.right - 70, self.rect.y + 8))
-
-        # 説明
-        desc_font: pygame.font.Font = self.fonts["small"]
-        desc_text: pygame.Surface = desc_font.render(
-            self.upgrade["description"], True, COLORS["text_light"]
-        )
-        surface.blit(desc_text, (self.rect.x + 10, self.rect.y + 32))
+        if level != self._level_key:
+            self._level_key = level
+            max_level: int | str = self.upgrade.get("max_level", "---")
+            self._level_surface = _TEXT_CACHE.render(
+                name_font, f"Lv.{level}/{max_level}", COLORS["text"]
+            )
 
         # コスト
-        cost: int = player.get_upgrade_cost(self.upgrade_id)
-        cost_color: tuple[int, int, int] = COLORS["gold"] if self.can_afford else COLORS["warning"]
-        cost_text: pygame.Surface = name_font.render(f"Cost: {cost:,}", True, cost_color)
-        surface.blit(cost_text, (self.rect.x + 10, self.rect.y + 55))
+        cost: int = self._cost
+        cost_key: tuple[int, bool] = (cost, self.can_afford)
+        if cost_key != self._cost_key:
+            self._cost_key = cost_key
+            cost_color: tuple[int, int, int] = (
+                COLORS["gold"] if self.can_afford else COLORS["warning"]
+            )
+            self._cost_surface = _TEXT_CACHE.render(name_font, f"Cost: {cost:,}", cost_color)
+
+        # 背景・名前・説明 / レベル / コスト
+        row_pos, level_pos, cost_pos = self._positions
+        return [
+            (self._rows[bg_color], row_pos),
+            (self._level_surface, level_pos),
+            (self._cost_surface, cost_pos),
+        ]
 
 
 class SettingsPanel:
@@ -366,6 +645,12 @@ class SettingsPanel:
             fonts["small"]
         )
 
+        # タイトル (固定文言なので一度だけ描画)
+        self._title: pygame.Surface = fonts["large"].render("設定", True, COLORS["text"])
+        self._title_rect: pygame.Rect = self._title.get_rect(
+            centerx=self.rect.centerx, y=self.y + 20
+        )
+
     def show(self) -> None:
         """表示"""
         self.is_visible = True
@@ -379,6 +664,24 @@ class SettingsPanel:
         if not self.is_visible:
             return None
 
+        # マウス以外のイベントはどの部品も使わない
+        etype: int = event.type
+        if (
+            etype != pygame.MOUSEMOTION
+            and etype != pygame.MOUSEBUTTONDOWN
+            and etype != pygame.MOUSEBUTTONUP
+        ):
+            return None
+        # パネル外の移動・クリックはどの部品にも当たらない (ドラッグ中は除く)
+        if (
+            etype != pygame.MOUSEBUTTONUP
+            and not self.rect.collidepoint(event.pos)
+            and not self.bgm_slider.is_dragging
+            and not self.sfx_slider.is_dragging
+        ):
+            self.close_button.is_hovered = False
+            return None
+
         result: dict[str, Any] = {}
 
         if self.bgm_slider.handle_event(event):
@@ -399,21 +702,14 @@ class SettingsPanel:
             return
 
         # 背景オーバーレイ
-        overlay: pygame.Surface = pygame.Surface(
-            (surface.get_width(), surface.get_height()), pygame.SRCALPHA
-        )
-        overlay.fill((0, 0, 0, 128))
-        surface.blit(overlay, (0, 0))
+        surface.blit(_get_overlay(surface.get_size()), (0, 0))
 
         # パネル背景
         pygame.draw.rect(surface, COLORS["white"], self.rect, border_radius=15)
         pygame.draw.rect(surface, COLORS["text"], self.rect, 3, border_radius=15)
 
         # タイトル
-        title_font: pygame.font.Font = self.fonts["large"]
-        title_text: pygame.Surface = title_font.render("設定", True, COLORS["text"])
-        title_rect: pygame.Rect = title_text.get_rect(centerx=self.rect.centerx, y=self.y + 20)
-        surface.blit(title_text, title_rect)
+        surface.blit(self._title, self._title_rect)
 
         # スライダー
         self.bgm_slider.draw(surface, self.fonts["small"])
@@ -456,6 +752,30 @@ class CharacterSelectPanel:
             self.y + self.height - 55,
             120, 40, "閉じる", fonts["small"],
         )
+        self._title: pygame.Surface = fonts["large"].render("キャラクター", True, COLORS["text"])
+        self._title_rect: pygame.Rect = self._title.get_rect(
+            centerx=self.rect.centerx, y=self.y + 12
+        )
+        # カードの固定テキスト (名前・テーマ・解放条件のヒント) と未解放の「？」
+        self._name_s: dict[str, pygame.Surface] = {}
+        self._theme_s: dict[str, pygame.Surface] = {}
+        self._hint_s: dict[str, pygame.Surface] = {}
+        for cid, info in CHARACTERS.items():
+            self._name_s[cid] = fonts["medium"].render(info["name"], True, COLORS["text"])
+            self._theme_s[cid] = fonts["small"].render(info["theme"], True, COLORS["text_light"])
+            cond = info["unlock_condition"]
+            if cond:
+                self._hint_s[cid] = fonts["small"].render(
+                    self._condition_hint(cond), True, COLORS["text_light"]
+                )
+        self._q_surf: pygame.Surface = fonts["xlarge"].render("？", True, COLORS["white"])
+        self._selected_s: pygame.Surface = fonts["small"].render("選択中", True, (255, 100, 100))
+        # 好感度表示 (キャラごとに (表示値, レベル名) が変わった時だけ描き直す)
+        self._aff_cache: dict[str, tuple[tuple[int, str], pygame.Surface]] = {}
+        # (キャラID, カードの矩形) の一覧 (配置は固定なので一度だけ求める)
+        self._cards: list[tuple[str, pygame.Rect]] = [
+            (cid, self._card_rect(i)) for i, cid in enumerate(CHARACTERS)
+        ]
 
     def show(self) -> None:
         self.is_visible = True
@@ -473,14 +793,14 @@ class CharacterSelectPanel:
             self.hide()
             return None
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            for i, (cid, info) in enumerate(CHARACTERS.items()):
-                card = self._card_rect(i)
-                if card.collidepoint(event.pos) and cid in char_mgr.unlocked:
+            for cid, card in self._cards:
+                if card.collidepoint(event.pos) and char_mgr.is_unlocked(cid):
                     self.hide()
                     return cid
         return None
 
     def _card_rect(self, index: int) -> pygame.Rect:
+        """index 番目のカードの矩形を求める (初期化時のみ使用)"""
         cols = 2
         card_w, card_h = 210, 140
         pad = 20
@@ -494,22 +814,15 @@ class CharacterSelectPanel:
         if not self.is_visible:
             return
         # オーバーレイ
-        overlay = pygame.Surface(
-            (surface.get_width(), surface.get_height()), pygame.SRCALPHA
-        )
-        overlay.fill((0, 0, 0, 128))
-        surface.blit(overlay, (0, 0))
+        surface.blit(_get_overlay(surface.get_size()), (0, 0))
         # パネル背景
         pygame.draw.rect(surface, COLORS["white"], self.rect, border_radius=15)
         pygame.draw.rect(surface, COLORS["text"], self.rect, 3, border_radius=15)
         # タイトル
-        title = self.fonts["large"].render("キャラクター", True, COLORS["text"])
-        tr = title.get_rect(centerx=self.rect.centerx, y=self.y + 12)
-        surface.blit(title, tr)
+        surface.blit(self._title, self._title_rect)
         # カード
-        for i, (cid, info) in enumerate(CHARACTERS.items()):
-            card = self._card_rect(i)
-            unlocked = cid in char_mgr.unlocked
+        for cid, card in self._cards:
+            unlocked = char_mgr.is_unlocked(cid)
             is_current = cid == char_mgr.current_id
             if unlocked:
                 bg = COLORS["primary"] if is_current else COLORS["accent"]
@@ -518,31 +831,34 @@ class CharacterSelectPanel:
             pygame.draw.rect(surface, bg, card, border_radius=10)
             pygame.draw.rect(surface, COLORS["text"], card, 2, border_radius=10)
             if unlocked:
-                name_s = self.fonts["medium"].render(info["name"], True, COLORS["text"])
-                surface.blit(name_s, (card.x + 10, card.y + 10))
-                theme_s = self.fonts["small"].render(info["theme"], True, COLORS["text_light"])
-                surface.blit(theme_s, (card.x + 10, card.y + 40))
+                surface.blit(self._name_s[cid], (card.x + 10, card.y + 10))
+                surface.blit(self._theme_s[cid], (card.x + 10, card.y + 40))
                 # 好感度
-                aff = char_mgr.get_affection(cid)
-                aff_lvl = char_mgr.get_affection_level_info(cid)
-                aff_text = f"好感度: {aff:.0f} ({aff_lvl['name']})"
-                aff_s = self.fonts["small"].render(aff_text, True, COLORS["text"])
-                surface.blit(aff_s, (card.x + 10, card.y + 65))
+                surface.blit(self._affection_surface(cid, char_mgr), (card.x + 10, card.y + 65))
                 if is_current:
-                    sel = self.fonts["small"].render("選択中", True, (255, 100, 100))
-                    surface.blit(sel, (card.x + 10, card.y + 110))
+                    surface.blit(self._selected_s, (card.x + 10, card.y + 110))
             else:
                 # シルエット + ヒント
-                q = self.fonts["xlarge"].render("？", True, COLORS["white"])
-                qr = q.get_rect(center=(card.centerx, card.y + 45))
-                surface.blit(q, qr)
-                cond = info["unlock_condition"]
-                if cond:
-                    hint = self._condition_hint(cond)
-                    h_s = self.fonts["small"].render(hint, True, COLORS["text_light"])
-                    surface.blit(h_s, (card.x + 10, card.y + 95))
+                qr = self._q_surf.get_rect(center=(card.centerx, card.y + 45))
+                surface.blit(self._q_surf, qr)
+                hint_s = self._hint_s.get(cid)
+                if hint_s is not None:
+                    surface.blit(hint_s, (card.x + 10, card.y + 95))
         self.close_button.draw(surface)
 
+    def _affection_surface(self, cid: str, char_mgr: CharacterManager) -> pygame.Surface:
+        """カードの好感度表示 (表示内容が変わった時だけ描き直す)"""
+        aff = char_mgr.get_affection(cid)
+        aff_lvl = char_mgr.get_affection_level_info(cid)
+        key: tuple[int, str] = (round(aff), aff_lvl["name"])
+        cached = self._aff_cache.get(cid)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        aff_text = f"好感度: {aff:.0f} ({aff_lvl['name']})"
+        aff_s = self.fonts["small"].render(aff_text, True, COLORS["text"])
+        self._aff_cache[cid] = (key, aff_s)
+        return aff_s
+
     @staticmethod
     def _condition_hint(cond: dict[str, Any]) -> str:
         t, v = cond["type"], cond["value"]
@@ -561,8 +877,21 @@ class CharacterSelectPanel:
 class AffectionBar:
     """キャラ下に表示する好感度バー"""
 
+    __slots__ = (
+        "_cache_key",
+        "_cache_surface",
+        "_heart",
+        "_inv_max",
+        "fonts",
+    )
+
     def __init__(self, fonts: dict[str, pygame.font.Font]) -> None:
         self.fonts = fonts
+        # 描画済みのバー (塗り幅・レベル名が変わった時だけ作り直す)
+        self._cache_key: tuple[int, str] | None = None
+        self._cache_surface: pygame.Surface | None = None
+        self._heart: pygame.Surface = fonts["small"].render("♥", True, (255, 100, 130))
+        self._inv_max: float = 1.0 / AFFECTION["max"]
 
     def draw(
         self,
@@ -571,28 +900,71 @@ class AffectionBar:
         y: int,
         char_mgr: CharacterManager,
     ) -> None:
+        surface.blit(*self.get_blit(x, y, char_mgr))
+
+    def get_blit(
+        self, x: int, y: int, char_mgr: CharacterManager
+    ) -> tuple[pygame.Surface, tuple[int, int]]:
+        """描画済みのバーと貼り付け位置を返す"""
         aff = char_mgr.get_affection()
         info = char_mgr.get_affection_level_info()
+        bar_w = 160
+        fill_w = int(bar_w * aff * self._inv_max)
+        key = (fill_w, info["name"])
+        if key != self._cache_key:
+            self._cache_key = key
+            self._cache_surface = self._build(fill_w, info["name"])
+        # ハートの左上 (バー左端 - 22, バー上端 - 4) を基準に貼る
+        return self._cache_surface, (x - bar_w // 2 - 22, y - 4)
+
+    def _build(self, fill_w: int, level_name: str) -> pygame.Surface:
         bar_w, bar_h = 160, 12
-        bx = x - bar_w // 2
-        by = y
+        lvl_s = self.fonts["small"].render(level_name, True, COLORS["text"])
+        # ハート (0, 0) / バー (22, 4) / レベル名 (22 + bar_w + 8, 0)
+        bx, by = 22, 4
+        width = bx + bar_w + 8 + lvl_s.get_width()
+        height = max(self._heart.get_height(), by + bar_h, lvl_s.get_height())
+        bar = pygame.Surface((width, height), pygame.SRCALPHA)
         # ハートアイコン(テキスト)
-        heart = self.fonts["small"].render("♥", True, (255, 100, 130))
-        surface.blit(heart, (bx - 22, by - 4))
+        bar.blit(self._heart, (0, 0))
         # バー背景
-        pygame.draw.rect(surface, COLORS["text_light"], (bx, by, bar_w, bar_h), border_radius=6)
+        pygame.draw.rect(bar, COLORS["text_light"], (bx, by, bar_w, bar_h), border_radius=6)
         # バー塗り
-        fill_w = int(bar_w * aff / AFFECTION["max"])
         if fill_w > 0:
-            pygame.draw.rect(surface, (255, 130, 160), (bx, by, fill_w, bar_h), border_radius=6)
+            pygame.draw.rect(bar, (255, 130, 160), (bx, by, fill_w, bar_h), border_radius=6)
         # レベル名
-        lvl_s = self.fonts["small"].render(info["name"], True, COLORS["text"])
-        surface.blit(lvl_s, (bx + bar_w + 8, by - 4))
+        bar.blit(lvl_s, (bx + bar_w + 8, 0))
+        return to_display_format(bar)
 
 
 # ==================================================================
 # 実績パネル
 # ==================================================================
+# 実績一覧の行の高さ・進捗バーの幅
+_ACHIEVEMENT_ROW_H: int = 52
+_ACHIEVEMENT_BAR_W: int = 160
+
+
+def _compile_progress(cond: dict[str, Any]) -> ProgressFunc | None:
+    """達成条件を (player, char_mgr) -> 進捗率 の関数に変換 (進捗を出さない条件は None)"""
+    t, v = cond["type"], cond["value"]
+    if t == "total_clicks":
+        return lambda p, c: p.total_clicks / v
+    if t == "total_points":
+        return lambda p, c: p.total_points_earned / v
+    if t == "total_upgrades":
+        return lambda p, c: p.total_upgrade_levels / v
+    if t == "max_affection":
+        return lambda p, c: c.get_max_affection() / v
+    return None
+
+
+# 実績ごとの進捗関数 (定義順、条件の種類による分岐は読み込み時に済ませる)
+_ACHIEVEMENT_PROGRESS: list[tuple[str, ProgressFunc | None]] = [
+    (aid, _compile_progress(info["condition"])) for aid, info in ACHIEVEMENTS.items()
+]
+
+
 class AchievementPanel:
     """実績一覧パネル"""
 
@@ -615,6 +987,25 @@ class AchievementPanel:
             self.y + self.height - 55,
             120, 40, "閉じる", fonts["small"],
         )
+        # 行ごとの固定テキスト (達成時の名前, 未達成時の名前, 報酬) と印
+        small: pygame.font.Font = fonts["small"]
+        self._row_text: dict[str, tuple[pygame.Surface, pygame.Surface, pygame.Surface]] = {
+            aid: (
+                small.render(info["name"], True, COLORS["text"]),
+                small.render(info["name"], True, COLORS["text_light"]),
+                small.render(f"+{info['reward']:,}pt", True, COLORS["gold"]),
+            )
+            for aid, info in ACHIEVEMENTS.items()
+        }
+        self._mark_done: pygame.Surface = fonts["medium"].render("✓", True, COLORS["success"])
+        self._mark_todo: pygame.Surface = fonts["medium"].render("○", True, COLORS["text_light"])
+        # 一覧の描画済みサーフェス (行ごとの達成状態・進捗の塗り幅をキーにする)
+        self._list_key: tuple[int | None, ...] | None = None
+        self._list_surface: pygame.Surface | None = None
+        # タイトル (達成数が変わった時だけ描き直す)
+        self._title_key: int | None = None
+        self._title: pygame.Surface | None = None
+        self._title_rect: pygame.Rect | None = None
 
     def show(self) -> None:
         self.is_visible = True
@@ -644,80 +1035,68 @@ class AchievementPanel:
         if not self.is_visible:
             return
         # オーバーレイ
-        overlay = pygame.Surface(
-            (surface.get_width(), surface.get_height()), pygame.SRCALPHA
-        )
-        overlay.fill((0, 0, 0, 128))
-        surface.blit(overlay, (0, 0))
+        surface.blit(_get_overlay(surface.get_size()), (0, 0))
         # パネル
         pygame.draw.rect(surface, COLORS["white"], self.rect, border_radius=15)
         pygame.draw.rect(surface, COLORS["text"], self.rect, 3, border_radius=15)
         # タイトル
-        total = len(ACHIEVEMENTS)
         done = len(unlocked_ids)
-        title = self.fonts["large"].render(f"実績  {done}/{total}", True, COLORS["text"])
-        tr = title.get_rect(centerx=self.rect.centerx, y=self.y + 12)
-        surface.blit(title, tr)
-        # クリッピング領域
+        if done != self._title_key:
+            self._title_key = done
+            total = len(ACHIEVEMENTS)
+            self._title = self.fonts["large"].render(f"実績  {done}/{total}", True, COLORS["text"])
+            self._title_rect = self._title.get_rect(centerx=self.rect.centerx, y=self.y + 12)
+        surface.blit(self._title, self._title_rect)
+        # 一覧 (行の状態が変わった時だけ組み直し、スクロール位置の部分だけ貼る)
         list_area = pygame.Rect(self.x + 10, self.y + 55, self.width - 20, self.height - 120)
-        surface.set_clip(list_area)
-        row_h = 52
-        iy = list_area.y - self.scroll_offset
-        for aid, info in ACHIEVEMENTS.items():
-            if iy + row_h < list_area.y:
-                iy += row_h
-                continue
-            if iy > list_area.bottom:
-                break
-            achieved = aid in unlocked_ids
+        unlocked = set(unlocked_ids)
+        bar_w = _ACHIEVEMENT_BAR_W
+        state: tuple[int | None, ...] = tuple(
+            -1 if aid in unlocked
+            else None if progress is None
+            else int(bar_w * min(1.0, progress(player, char_mgr)))
+            for aid, progress in _ACHIEVEMENT_PROGRESS
+        )
+        if state != self._list_key:
+            self._list_key = state
+            self._list_surface = self._build_list(list_area.width, state)
+        surface.blit(
+            self._list_surface,
+            list_area.topleft,
+            (0, self.scroll_offset, list_area.width, list_area.height),
+        )
+        self.close_button.draw(surface)
+
+    def _build_list(self, width: int, state: tuple[int | None, ...]) -> pygame.Surface:
+        """全実績の行を 1 枚に描画 (state: 達成済みは -1、未達成は進捗バーの塗り幅)"""
+        row_h = _ACHIEVEMENT_ROW_H
+        # パネルと同じ白で塗りつぶした不透明サーフェス (直接描いた時と同じ見た目になる)
+        list_surface = pygame.Surface((width, row_h * len(state)))
+        list_surface.fill(COLORS["white"])
+        for i, ((aid, _), fill_w) in enumerate(zip(_ACHIEVEMENT_PROGRESS, state)):
+            iy = i * row_h
+            achieved = fill_w == -1
+            name_done, name_todo, reward = self._row_text[aid]
             # 行背景
-            row_rect = pygame.Rect(list_area.x, iy, list_area.width, row_h - 4)
-            bg = COLORS["accent"] if achieved else (*COLORS["text_light"], 80)
-            pygame.draw.rect(surface, bg, row_rect, border_radius=8)
+            row_rect = pygame.Rect(0, iy, width, row_h - 4)
+            bg = COLORS["accent"] if achieved else _ROW_TODO_RGBA
+            pygame.draw.rect(list_surface, bg, row_rect, border_radius=8)
             # チェック / グレー
-            mark = "✓" if achieved else "○"
-            mark_c = COLORS["success"] if achieved else COLORS["text_light"]
-            ms = self.fonts["medium"].render(mark, True, mark_c)
-            surface.blit(ms, (row_rect.x + 8, iy + 4))
+            list_surface.blit(self._mark_done if achieved else self._mark_todo, (8, iy + 4))
             # 名前
-            name_c = COLORS["text"] if achieved else COLORS["text_light"]
-            ns = self.fonts["small"].render(info["name"], True, name_c)
-            surface.blit(ns, (row_rect.x + 40, iy + 4))
+            list_surface.blit(name_done if achieved else name_todo, (40, iy + 4))
             # 報酬
-            rw = self.fonts["small"].render(f"+{info['reward']:,}pt", True, COLORS["gold"])
-            surface.blit(rw, (row_rect.right - 80, iy + 4))
+            list_surface.blit(reward, (row_rect.right - 80, iy + 4))
             # 進捗バー (未達成)
-            if not achieved:
-                prog = self._get_progress(aid, info, player, char_mgr)
-                if prog is not None:
-                    bar_w = 160
-                    bar_rect = pygame.Rect(row_rect.x + 40, iy + 28, bar_w, 8)
-                    pygame.draw.rect(surface, COLORS["white"], bar_rect, border_radius=4)
-                    fw = int(bar_w * min(1.0, prog))
-                    if fw > 0:
-                        pygame.draw.rect(
-                            surface, COLORS["primary"],
-                            (bar_rect.x, bar_rect.y, fw, 8), border_radius=4,
-                        )
-            iy += row_h
-        # クリップ解除
-        surface.set_clip(None)
-        self.close_button.draw(surface)
-
-    def _get_progress(
-        self, aid: str, info: dict[str, Any], player: Player, char_mgr: CharacterManager
-    ) -> float | None:
-        cond = info["condition"]
-        t, v = cond["type"], cond["value"]
-        if t == "total_clicks":
-            return player.total_clicks / v
-        if t == "total_points":
-            return player.total_points_earned / v
-        if t == "total_upgrades":
-            return sum(player.upgrade_levels.values()) / v
-        if t == "max_affection":
-            return char_mgr.get_max_affection() / v
-        return None
+            if not achieved and fill_w is not None:
+                bar_rect = pygame.Rect(40, iy + 28, _ACHIEVEMENT_BAR_W, 8)
+                pygame.draw.rect(list_surface, COLORS["white"], bar_rect, border_radius=4)
+                if fill_w > 0:
+                    pygame.draw.rect(
+                        list_surface, COLORS["primary"],
+                        (bar_rect.x, bar_rect.y, fill_w, 8), border_radius=4,
+                    )
+        return list_surface
 
 
 # ==================================================================
@@ -726,6 +1105,18 @@ class AchievementPanel:
 class ToastNotification:
     """画面上部からスライドインするトースト"""
 
+    __slots__ = (
+        "_banners",
+        "_current",
+        "_inv_slide",
+        "_queue",
+        "_show_duration",
+        "_slide_duration",
+        "_text_surface",
+        "_timer",
+        "fonts",
+    )
+
     def __init__(self, fonts: dict[str, pygame.font.Font]) -> None:
         self.fonts = fonts
         self._queue: list[dict[str, Any]] = []
@@ -733,14 +1124,27 @@ class ToastNotification:
         self._timer: float = 0.0
         self._show_duration: float = 3.0
         self._slide_duration: float = 0.3
+        self._inv_slide: float = 1.0 / self._slide_duration
+        # 枠色ごとの描画済みバナー背景と、表示中トーストの文字
+        self._banners: dict[tuple[int, int, int], pygame.Surface] = {}
+        self._text_surface: pygame.Surface | None = None
 
     def push(self, text: str, color: tuple[int, int, int] | None = None) -> None:
         self._queue.append({"text": text, "color": color or COLORS["gold"]})
 
+    def is_idle(self) -> bool:
+        """表示中・待機中のトーストが無いか"""
+        return self._current is None and not self._queue
+
     def update(self, dt: float) -> None:
         if self._current is None:
             if self._queue:
                 self._current = self._queue.pop(0)
+                self._text_surface = to_display_format(
+                    self.fonts["medium"].render(
+                        self._current["text"], True, self._current["color"]
+                    )
+                )
                 self._timer = 0.0
             return
         self._timer += dt
@@ -753,18 +1157,29 @@ class ToastNotification:
         t = self._timer
         # スライドイン
         if t < self._slide_duration:
-            ratio = t / self._slide_duration
+            ratio = t * self._inv_slide
             y = int(-50 + 60 * ratio)
         elif t < self._show_duration:
             y = 10
         else:
-            ratio = (t - self._show_duration) / self._slide_duration
+            ratio = (t - self._show_duration) * self._inv_slide
             y = int(10 - 60 * ratio)
         banner_w = 450
         bx = (surface.get_width() - banner_w) // 2
         banner = pygame.Rect(bx, y, banner_w, 44)
-        pygame.draw.rect(surface, (*COLORS["white"], 230), banner, border_radius=12)
-        pygame.draw.rect(surface, self._current["color"], banner, 2, border_radius=12)
-        ts = self.fonts["medium"].render(self._current["text"], True, self._current["color"])
+        surface.blit(self._get_banner(self._current["color"]), banner)
+        ts = self._text_surface
         tr = ts.get_rect(center=banner.center)
         surface.blit(ts, tr)
+
+    def _get_banner(self, color: tuple[int, int, int]) -> pygame.Surface:
+        """枠色に対応する角丸バナー背景を返す (初回だけ描画)"""
+        banner: pygame.Surface | None = self._banners.get(color)
+        if banner is None:
+            banner = pygame.Surface((450, 44), pygame.SRCALPHA)
+            rect = banner.get_rect()
+            pygame.draw.rect(banner, COLORS["white"], rect, border_radius=12)
+            pygame.draw.rect(banner, color, rect, 2, border_radius=12)
+            banner = to_display_format(banner)
+            self._banners[color] = banner
+        return banner